@@ -58,13 +58,39 @@ void stinger_scc_reset_stats(stinger_connected_components_stats* stats);
 int stinger_scc_insertion(struct stinger * S, int64_t nv,  stinger_scc_internal scc_internal, 
 	stinger_connected_components_stats* stats, stinger_edge_update* batch,int64_t batch_size);
 
-int stinger_scc_deletion(struct stinger * S, int64_t nv,  stinger_scc_internal scc_internal, 
+int stinger_scc_deletion(struct stinger * S, int64_t nv,  stinger_scc_internal scc_internal,
 	stinger_connected_components_stats* stats, stinger_edge_update* batch,int64_t batch_size);
 
+// Insertion kernels specialized for common parentsPerVertex values so the
+// compiler can unroll the per-parent loops; stinger_scc_insertion picks
+// the right one at runtime and _ppv_dyn is the generic fallback.
+int stinger_scc_insertion_ppv4(struct stinger * S, int64_t nv, stinger_scc_internal scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch, int64_t batch_size);
+int stinger_scc_insertion_ppv8(struct stinger * S, int64_t nv, stinger_scc_internal scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch, int64_t batch_size);
+int stinger_scc_insertion_ppv_dyn(struct stinger * S, int64_t nv, stinger_scc_internal scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch, int64_t batch_size);
+
 
 // Gets the connected component mapping of the dynamic graph algorithm.
 const int64_t* stinger_scc_get_components(stinger_scc_internal scc_internal);
 
 void stinger_scc_copy_component_array(stinger_scc_internal scc_internal,int64_t* destArray);
 
+// Opaque-handle variants of the API above: the internals live on the heap
+// and are passed by pointer, so callers (e.g. language bindings) never
+// mirror or copy the struct across the call boundary.
+stinger_scc_internal * stinger_scc_internals_new(struct stinger * S, int64_t nv, int64_t parentsPerVertex);
+void stinger_scc_internals_free(stinger_scc_internal ** scc_internal);
+
+int stinger_scc_insertion_batch(struct stinger * S, int64_t nv, stinger_scc_internal * scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch, int64_t batch_size);
+
+int stinger_scc_deletion_batch(struct stinger * S, int64_t nv, stinger_scc_internal * scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch, int64_t batch_size);
+
+const int64_t* stinger_scc_internals_get_components(const stinger_scc_internal * scc_internal);
+
+void stinger_scc_internals_copy_component_array(const stinger_scc_internal * scc_internal, int64_t* destArray);
+
 #endif
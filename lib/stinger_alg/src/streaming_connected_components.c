@@ -544,8 +544,12 @@ int64_t bfs_component_stats (uint64_t nv, int64_t * sizes, int64_t previous_num)
   return num_components;
 }
 
-int stinger_scc_insertion(struct stinger * S, int64_t nv,  stinger_scc_internal scc_internal, 
-	stinger_connected_components_stats* stats, stinger_edge_update* batch,int64_t batch_size){
+/* The insertion batch loop with parentsPerVertex taken as a parameter.
+ * Wrappers below call this with a compile-time constant so the compiler
+ * can unroll the per-parent loops in update_tree_for_insert_directed. */
+static inline int stinger_scc_insertion_kernel(struct stinger * S, int64_t nv,  stinger_scc_internal scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch,int64_t batch_size,
+	const int64_t parentsPerVertex){
 
 	// stinger_connected_components_stats* stats, int64_t *batch,int64_t batch_size){
   	/* Updates */
@@ -572,8 +576,8 @@ int stinger_scc_insertion(struct stinger * S, int64_t nv,  stinger_scc_internal
 		/* if not self-loop */
 		if(i != j) {
 		  /* if a new edge in stinger, update parents */
-			if(update_tree_for_insert_directed(scc_internal.parentArray, scc_internal.parentCounter, 
-				scc_internal.level, scc_internal.bfs_components, scc_internal.parentsPerVertex, i, j,stats)) {
+			if(update_tree_for_insert_directed(scc_internal.parentArray, scc_internal.parentCounter,
+				scc_internal.level, scc_internal.bfs_components, parentsPerVertex, i, j,stats)) {
 			  bfs_inserts_bridged++;
 			  /* if component ids are not the same       *
 			   * tree update not handled, push onto queue*/
@@ -582,8 +586,8 @@ int stinger_scc_insertion(struct stinger * S, int64_t nv,  stinger_scc_internal
 			  action_stack[which+1] = j;
 			}
 		  /* same but for reverse edge j,i */
-			if(update_tree_for_insert_directed(scc_internal.parentArray, scc_internal.parentCounter, 
-				scc_internal.level, scc_internal.bfs_components, scc_internal.parentsPerVertex, j, i,stats)) {
+			if(update_tree_for_insert_directed(scc_internal.parentArray, scc_internal.parentCounter,
+				scc_internal.level, scc_internal.bfs_components, parentsPerVertex, j, i,stats)) {
 			  bfs_inserts_bridged++;
 			  int64_t which = stinger_int64_fetch_add(&insert_stack_top, -2);
 			  action_stack[which] = j;
@@ -613,7 +617,7 @@ int stinger_scc_insertion(struct stinger * S, int64_t nv,  stinger_scc_internal
 		SWAP_UINT64(Ci_size, Cj_size)
 	  }
 
-	  scc_internal.parentArray[i*scc_internal.parentsPerVertex] = j;
+	  scc_internal.parentArray[i*parentsPerVertex] = j;
 	  scc_internal.parentCounter[i] = 1;
 	  /* handle singleton */
 	  if(Ci_size == 1) {
@@ -621,9 +625,9 @@ int stinger_scc_insertion(struct stinger * S, int64_t nv,  stinger_scc_internal
 		scc_internal.bfs_component_sizes[Cj]++;
 		scc_internal.bfs_components[i] = Cj;
 	  } else {
-		scc_internal.bfs_component_sizes[Cj] += bfs_build_new_component(S, i, Cj, 
-			(scc_internal.level[j] >= 0 ? scc_internal.level[j] : ~scc_internal.level[j])+1, 
-			scc_internal.queue, scc_internal.level, scc_internal.parentArray, scc_internal.parentsPerVertex, 
+		scc_internal.bfs_component_sizes[Cj] += bfs_build_new_component(S, i, Cj,
+			(scc_internal.level[j] >= 0 ? scc_internal.level[j] : ~scc_internal.level[j])+1,
+			scc_internal.queue, scc_internal.level, scc_internal.parentArray, parentsPerVertex,
 			scc_internal.parentCounter, scc_internal.bfs_components);
 		scc_internal.bfs_component_sizes[Ci] = 0;
 	  }
@@ -631,6 +635,36 @@ int stinger_scc_insertion(struct stinger * S, int64_t nv,  stinger_scc_internal
 
 	free(action_stack);
 	free(action_stack_components);
+
+	return 0;
+}
+
+/* Specialized variants for the common parentsPerVertex shapes.  The
+ * kernel is inlined into each wrapper with parentsPerVertex constant,
+ * so the per-parent loops unroll; _ppv_dyn keeps the generic path. */
+int stinger_scc_insertion_ppv4(struct stinger * S, int64_t nv,  stinger_scc_internal scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch,int64_t batch_size){
+	return stinger_scc_insertion_kernel(S, nv, scc_internal, stats, batch, batch_size, 4);
+}
+
+int stinger_scc_insertion_ppv8(struct stinger * S, int64_t nv,  stinger_scc_internal scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch,int64_t batch_size){
+	return stinger_scc_insertion_kernel(S, nv, scc_internal, stats, batch, batch_size, 8);
+}
+
+int stinger_scc_insertion_ppv_dyn(struct stinger * S, int64_t nv,  stinger_scc_internal scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch,int64_t batch_size){
+	return stinger_scc_insertion_kernel(S, nv, scc_internal, stats, batch, batch_size,
+		scc_internal.parentsPerVertex);
+}
+
+int stinger_scc_insertion(struct stinger * S, int64_t nv,  stinger_scc_internal scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch,int64_t batch_size){
+	switch(scc_internal.parentsPerVertex) {
+	  case 4:  return stinger_scc_insertion_ppv4(S, nv, scc_internal, stats, batch, batch_size);
+	  case 8:  return stinger_scc_insertion_ppv8(S, nv, scc_internal, stats, batch, batch_size);
+	  default: return stinger_scc_insertion_ppv_dyn(S, nv, scc_internal, stats, batch, batch_size);
+	}
 }
 
 int stinger_scc_deletion(struct stinger * S, int64_t nv,  stinger_scc_internal scc_internal, 
@@ -806,10 +840,46 @@ void stinger_scc_initialize_internals(struct stinger * S, int64_t nv, stinger_sc
 }
 
 void stinger_scc_release_internals(stinger_scc_internal* scc_internal){
-  free(scc_internal->bfsDataPtr); 
+  free(scc_internal->bfsDataPtr);
   free(scc_internal->parentsDataPtr);
 }
 
+/* Opaque-handle variants of the API above.  The by-value
+ * stinger_scc_internal interface forces callers (FFI bindings in
+ * particular) to mirror the 13-field struct and copy it across the call
+ * boundary on every batch; these wrappers keep the struct on the heap
+ * and pass a single pointer instead. */
+
+stinger_scc_internal * stinger_scc_internals_new(struct stinger * S, int64_t nv, int64_t parentsPerVertex){
+	stinger_scc_internal * scc_internal = xmalloc(sizeof(stinger_scc_internal));
+	stinger_scc_initialize_internals(S, nv, scc_internal, parentsPerVertex);
+	return scc_internal;
+}
+
+void stinger_scc_internals_free(stinger_scc_internal ** scc_internal){
+	stinger_scc_release_internals(*scc_internal);
+	free(*scc_internal);
+	*scc_internal = NULL;
+}
+
+int stinger_scc_insertion_batch(struct stinger * S, int64_t nv, stinger_scc_internal * scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch, int64_t batch_size){
+	return stinger_scc_insertion(S, nv, *scc_internal, stats, batch, batch_size);
+}
+
+int stinger_scc_deletion_batch(struct stinger * S, int64_t nv, stinger_scc_internal * scc_internal,
+	stinger_connected_components_stats* stats, stinger_edge_update* batch, int64_t batch_size){
+	return stinger_scc_deletion(S, nv, *scc_internal, stats, batch, batch_size);
+}
+
+const int64_t* stinger_scc_internals_get_components(const stinger_scc_internal * scc_internal){
+	return scc_internal->bfs_components;
+}
+
+void stinger_scc_internals_copy_component_array(const stinger_scc_internal * scc_internal, int64_t* destArray){
+	memcpy(destArray, scc_internal->bfs_components, sizeof(int64_t)*scc_internal->nv);
+}
+
 
 
 // The following is a demo main on how to run the streaming connected components code.
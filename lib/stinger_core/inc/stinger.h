@@ -99,12 +99,37 @@ int stinger_incr_edge_pair (struct stinger *, int64_t /* type */ ,
 			    int64_t /* int weight */ ,
 			    int64_t /* timestamp */ );
 
+int stinger_insert_edges (struct stinger *, const int64_t * /* types */ ,
+			  const int64_t * /* froms */ , const int64_t * /* tos */ ,
+			  const int64_t * /* weights */ ,
+			  const int64_t * /* timestamps */ ,
+			  int64_t /* count */ );
+
+int stinger_insert_edge_pairs (struct stinger *, const int64_t * /* types */ ,
+			       const int64_t * /* froms */ , const int64_t * /* tos */ ,
+			       const int64_t * /* weights */ ,
+			       const int64_t * /* timestamps */ ,
+			       int64_t /* count */ );
+
+int stinger_ingest_named_edges (struct stinger *, const char * /* byte_strings */ ,
+				const int64_t * /* from_offs */ , const int64_t * /* to_offs */ ,
+				const int64_t * /* types */ , const int64_t * /* weights */ ,
+				const int64_t * /* timestamps */ , int64_t /* count */ );
+
 int stinger_remove_edge (struct stinger *, int64_t /* type */ ,
 			 int64_t /* from */ , int64_t /* to */ );
 
 int stinger_remove_edge_pair (struct stinger *, int64_t /* type */ ,
 			      int64_t /* from */ , int64_t /* to */ );
 
+int64_t stinger_remove_edges (struct stinger *, const int64_t * /* types */ ,
+			      const int64_t * /* froms */ , const int64_t * /* tos */ ,
+			      int64_t /* count */ );
+
+int64_t stinger_remove_edge_pairs (struct stinger *, const int64_t * /* types */ ,
+				   const int64_t * /* froms */ , const int64_t * /* tos */ ,
+				   int64_t /* count */ );
+
 void stinger_remove_all_edges_of_type (struct stinger *G, int64_t type);
 
 int64_t stinger_remove_vertex(struct stinger *G, int64_t vtx_id);
@@ -227,9 +252,15 @@ stinger_adjacency_get(const stinger_t * S, vindex_t v);
 int
 stinger_mapping_create(const stinger_t * S, const char * byte_string, uint64_t length, int64_t * vtx_out);
 
+int
+stinger_mapping_create_batch(const stinger_t * S, const char * byte_strings, const int64_t * offsets, int64_t count, int64_t * vtx_out);
+
 vindex_t
 stinger_mapping_lookup(const stinger_t * S, const char * byte_string, uint64_t length);
 
+void
+stinger_mapping_lookup_batch(const stinger_t * S, const char * byte_strings, const int64_t * offsets, int64_t count, int64_t * vtx_out);
+
 int
 stinger_mapping_physid_get(const stinger_t * S, vindex_t vertexID, char ** outbuffer, uint64_t * outbufferlength);
 
@@ -290,6 +321,17 @@ void stinger_gather_successors (const struct stinger *,
 					  int64_t * /* out_type_optional */,
                                           size_t max_outlen);
 
+void stinger_gather_successors_range (const struct stinger *,
+                                          int64_t /* vtx */,
+                                          int64_t /* start */,
+                                          size_t * /* outlen */,
+                                          int64_t * /* out_vtx */,
+					  int64_t * /* out_weight_optional */,
+					  int64_t * /* out_timefirst_optional */,
+                                          int64_t * /* out_timerecent_optional */,
+					  int64_t * /* out_type_optional */,
+                                          size_t max_outlen);
+
 void stinger_gather_typed_successors (const struct stinger *,
 				      int64_t /* type */ ,
 				      int64_t /* vtx */ ,
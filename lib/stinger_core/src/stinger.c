@@ -166,11 +166,41 @@ stinger_mapping_create(const stinger_t * S, const char * byte_string, uint64_t l
   return stinger_physmap_mapping_create(stinger_physmap_get(S), stinger_vertices_get(S), byte_string, length, vtx_out);
 }
 
+int
+stinger_mapping_create_batch(const stinger_t * S, const char * byte_strings, const int64_t * offsets, int64_t count, int64_t * vtx_out) {
+  int returnCode = 0;
+
+  /* Each name starts at byte_strings + offsets[i] and is NUL-terminated;
+   * offsets[count] marks the end of the buffer.  The physical map is
+   * safe for concurrent creates, so the loop runs under OpenMP. */
+  OMP("omp parallel for reduction(|:returnCode)")
+  for (int64_t i = 0; i < count; i++) {
+    if (stinger_mapping_create (S, byte_strings + offsets[i],
+                                offsets[i+1] - offsets[i] - 1, vtx_out + i) < 0) {
+      returnCode |= 1;
+    }
+  }
+
+  return returnCode ? -1 : 0;
+}
+
 vindex_t
 stinger_mapping_lookup(const stinger_t * S, const char * byte_string, uint64_t length) {
   return stinger_physmap_vtx_lookup(stinger_physmap_get(S), stinger_vertices_get(S), byte_string, length);
 }
 
+void
+stinger_mapping_lookup_batch(const stinger_t * S, const char * byte_strings, const int64_t * offsets, int64_t count, int64_t * vtx_out) {
+  /* Same packed layout as stinger_mapping_create_batch(); missing names
+   * produce -1 in vtx_out.  Lookups are read-only, so the loop is
+   * parallel. */
+  OMP("omp parallel for")
+  for (int64_t i = 0; i < count; i++) {
+    vtx_out[i] = stinger_mapping_lookup (S, byte_strings + offsets[i],
+                                         offsets[i+1] - offsets[i] - 1);
+  }
+}
+
 int
 stinger_mapping_physid_get(const stinger_t * S, vindex_t vertexID, char ** outbuffer, uint64_t * outbufferlength) {
   return stinger_physmap_id_get(stinger_physmap_get(S), stinger_vertices_get(S), vertexID, outbuffer, outbufferlength);
@@ -1409,6 +1439,124 @@ stinger_incr_edge_pair (struct stinger *G,
     return rtn | (rtn2 << 1);
 }
 
+/** @brief Insert a batch of directed edges.
+ *
+ *  Applies stinger_insert_edge() to each of the count edges described by
+ *  the parallel input arrays.  The loop is parallelized with OpenMP, so
+ *  callers (in particular language bindings) pay one call for the whole
+ *  batch instead of one per edge.
+ *
+ *  @param G The STINGER data structure
+ *  @param type Array of edge types
+ *  @param from Array of source vertex IDs
+ *  @param to Array of destination vertex IDs
+ *  @param weight Array of edge weights
+ *  @param timestamp Array of edge timestamps
+ *  @param count Number of edges in the batch
+ *  @return 0 if all edges were applied, -1 if any insertion failed.
+ */
+
+int
+stinger_insert_edges (struct stinger *G,
+                      const int64_t * type, const int64_t * from,
+                      const int64_t * to, const int64_t * weight,
+                      const int64_t * timestamp, int64_t count)
+{
+  int returnCode = 0;
+
+  OMP("omp parallel for reduction(|:returnCode)")
+  for (int64_t i = 0; i < count; i++) {
+    if (stinger_insert_edge (G, type[i], from[i], to[i], weight[i], timestamp[i]) < 0) {
+      returnCode |= 1;
+    }
+  }
+
+  return returnCode ? -1 : 0;
+}
+
+/** @brief Insert a batch of undirected edges.
+ *
+ *  Applies stinger_insert_edge_pair() to each of the count edges described
+ *  by the parallel input arrays.  The loop is parallelized with OpenMP.
+ *
+ *  @param G The STINGER data structure
+ *  @param type Array of edge types
+ *  @param from Array of source vertex IDs
+ *  @param to Array of destination vertex IDs
+ *  @param weight Array of edge weights
+ *  @param timestamp Array of edge timestamps
+ *  @param count Number of edges in the batch
+ *  @return 0 if all edges were applied, -1 if any insertion failed.
+ */
+
+int
+stinger_insert_edge_pairs (struct stinger *G,
+                           const int64_t * type, const int64_t * from,
+                           const int64_t * to, const int64_t * weight,
+                           const int64_t * timestamp, int64_t count)
+{
+  int returnCode = 0;
+
+  OMP("omp parallel for reduction(|:returnCode)")
+  for (int64_t i = 0; i < count; i++) {
+    if (stinger_insert_edge_pair (G, type[i], from[i], to[i], weight[i], timestamp[i]) < 0) {
+      returnCode |= 1;
+    }
+  }
+
+  return returnCode ? -1 : 0;
+}
+
+/** @brief Map a batch of named edges and insert them in one sweep.
+ *
+ *  For each of the count edges, creates (or looks up) the mappings of
+ *  both endpoint names and applies stinger_insert_edge_pair(), all
+ *  inside one OpenMP loop, so ingest pays one library call per batch
+ *  instead of three per edge.  Names live in a shared buffer and are
+ *  NUL-terminated; from_off and to_off give the starting byte of each
+ *  endpoint name.  The physical map is safe for concurrent creates, as
+ *  is the insert path, so the loop is parallel.
+ *
+ *  @param G The STINGER data structure
+ *  @param byte_strings Packed buffer of NUL-terminated vertex names
+ *  @param from_off Offset of each source name in byte_strings
+ *  @param to_off Offset of each destination name in byte_strings
+ *  @param type Array of edge types
+ *  @param weight Array of edge weights
+ *  @param timestamp Array of edge timestamps
+ *  @param count Number of edges in the batch
+ *  @return 0 if all edges were applied, -1 if any mapping or insertion failed.
+ */
+
+int
+stinger_ingest_named_edges (struct stinger *G, const char * byte_strings,
+                            const int64_t * from_off, const int64_t * to_off,
+                            const int64_t * type, const int64_t * weight,
+                            const int64_t * timestamp, int64_t count)
+{
+  int returnCode = 0;
+
+  OMP("omp parallel for reduction(|:returnCode)")
+  for (int64_t i = 0; i < count; i++) {
+    const char * from_name = byte_strings + from_off[i];
+    const char * to_name = byte_strings + to_off[i];
+    int64_t from = -1;
+    int64_t to = -1;
+
+    if (stinger_mapping_create (G, from_name, strlen (from_name), &from) < 0 ||
+        stinger_mapping_create (G, to_name, strlen (to_name), &to) < 0) {
+      returnCode |= 1;
+      continue;
+    }
+
+    if (stinger_insert_edge_pair (G, type[i], from, to, weight[i], timestamp[i]) < 0) {
+      returnCode |= 1;
+    }
+  }
+
+  return returnCode ? -1 : 0;
+}
+
 /** @brief Removes a directed edge.
  *
  *  Remove a typed, directed edge.
@@ -1419,9 +1567,9 @@ stinger_incr_edge_pair (struct stinger *G,
  *  @param type Edge type
  *  @param from Source vertex ID
  *  @param to Destination vertex ID
- *  @return 1 on success, 0 if the edge is not found.
+ *  @return 1 on success, -1 if the edge is not found.
  */
- 
+
 int
 stinger_remove_edge (struct stinger *G,
                      int64_t type, int64_t from, int64_t to)
@@ -1559,6 +1707,78 @@ stinger_remove_edge_pair (struct stinger *G,
     return rtn | (rtn2 << 1);
 }
 
+/** @brief Removes a batch of directed edges.
+ *
+ *  Applies stinger_remove_edge() to each of the count edges described by
+ *  the parallel input arrays.  Removal is not safe for concurrent calls
+ *  on the same source vertex, so unlike the batch insert paths this loop
+ *  runs serially; the savings come from paying the call overhead once
+ *  per batch.
+ *
+ *  @param G The STINGER data structure
+ *  @param type Array of edge types
+ *  @param from Array of source vertex IDs
+ *  @param to Array of destination vertex IDs
+ *  @param count Number of edges in the batch
+ *  @return Number of edges actually removed; edges not present count as
+ *    zero and do not stop the batch.
+ */
+
+int64_t
+stinger_remove_edges (struct stinger *G,
+                      const int64_t * type, const int64_t * from,
+                      const int64_t * to, int64_t count)
+{
+  int64_t removed = 0;
+
+  for (int64_t i = 0; i < count; i++) {
+    /* stinger_remove_edge() returns -1 for an edge that is not
+     * present; that is a per-edge miss, not a batch failure. */
+    if (stinger_remove_edge (G, type[i], from[i], to[i]) > 0) {
+      removed++;
+    }
+  }
+
+  return removed;
+}
+
+/** @brief Removes a batch of undirected edges.
+ *
+ *  Applies stinger_remove_edge_pair() to each of the count edges
+ *  described by the parallel input arrays.  See stinger_remove_edges()
+ *  for why the loop is serial.
+ *
+ *  @param G The STINGER data structure
+ *  @param type Array of edge types
+ *  @param from Array of source vertex IDs
+ *  @param to Array of destination vertex IDs
+ *  @param count Number of edges in the batch
+ *  @return Number of edge pairs with at least one direction removed;
+ *    pairs with neither direction present count as zero and do not
+ *    stop the batch.
+ */
+
+int64_t
+stinger_remove_edge_pairs (struct stinger *G,
+                           const int64_t * type, const int64_t * from,
+                           const int64_t * to, int64_t count)
+{
+  int64_t removed = 0;
+
+  for (int64_t i = 0; i < count; i++) {
+    /* Remove the two directions separately rather than through
+     * stinger_remove_edge_pair(), whose -1 return cannot distinguish
+     * "both missing" from "one direction removed, the other missing". */
+    int rtn = stinger_remove_edge (G, type[i], from[i], to[i]);
+    int rtn2 = stinger_remove_edge (G, type[i], to[i], from[i]);
+    if (rtn > 0 || rtn2 > 0) {
+      removed++;
+    }
+  }
+
+  return removed;
+}
+
 
 
 /* FIXME: Doesn't follow the STINGER direction standards.  Only inserts out edges */
@@ -1866,6 +2086,64 @@ stinger_gather_successors (const struct stinger *G,
   *outlen = (kout < max_outlen)?kout:max_outlen;               /* May be longer than max_outlen. */
 }
 
+/** @brief Copy a slice of the adjacencies of a vertex into a buffer
+ *
+ *  Like stinger_gather_successors(), but skips the first start valid
+ *  edges and copies at most max_outlen of the following ones, so large
+ *  adjacency lists can be gathered in cache-sized chunks.  The walk is
+ *  serial, which gives a stable edge order across calls as long as the
+ *  graph is not modified between them; the skip only reads the
+ *  destination of each edge, not its metadata.
+ *
+ *  @param G The STINGER data structure
+ *  @param v Source vertex ID
+ *  @param start Number of valid edges to skip before copying
+ *  @param outlen Number of adjacencies copied
+ *  @param out Buffer of destination vertices
+ *  @param weight OPTIONAL Buffer of edge weights
+ *  @param timefirst OPTIONAL Buffer of timefirst values
+ *  @param timerecent OPTIONAL Buffer of timerecent values
+ *  @param type OPTIONAL Buffer of edge types
+ *  @param max_outlen Size of out and any optional buffers
+ */
+void
+stinger_gather_successors_range (const struct stinger *G,
+                            int64_t v,
+                            int64_t start,
+                            size_t * outlen,
+                            int64_t * out,
+                            int64_t * weight,
+                            int64_t * timefirst,
+                            int64_t * timerecent,
+                            int64_t * type,
+                            size_t max_outlen)
+{
+  size_t kout = 0;
+  int64_t skip = start;
+
+  assert (G);
+
+  // Hack to get around constant warnings.  FIXME: Requires the READ_ONLY macros to be fixed!
+  struct stinger * G2 = *(struct stinger **)&G;
+
+  STINGER_FORALL_OUT_EDGES_OF_VTX_BEGIN(G2, v) {
+    if (STINGER_EDGE_DEST >= 0) {
+      if (skip > 0) {
+        skip--;
+      } else if (kout < max_outlen) {
+        out[kout] = STINGER_EDGE_DEST;
+        if(weight) weight[kout] = STINGER_EDGE_WEIGHT;
+        if(timefirst) timefirst[kout] = STINGER_EDGE_TIME_FIRST;
+        if(timerecent) timerecent[kout] = STINGER_EDGE_TIME_RECENT;
+        if(type) type[kout] = STINGER_EDGE_TYPE;
+        kout++;
+      }
+    }
+  } STINGER_FORALL_OUT_EDGES_OF_VTX_END();
+
+  *outlen = kout;
+}
+
 /** @brief Copy typed adjacencies of a vertex into a buffer
  *
  *  For a given edge type, adjacencies of the specified vertex are copied into
@@ -0,0 +1,31 @@
+# Builds the optional Cython accelerator module stinger.stinger_cycore
+# against an existing STINGER build tree:
+#
+#   STINGER_BUILD=../../build python setup.py build_ext --inplace
+#
+# The pure-ctypes modules work without this step.
+import os
+
+from distutils.core import setup
+from distutils.extension import Extension
+
+from Cython.Build import cythonize
+import numpy as np
+
+build_dir = os.getenv('STINGER_BUILD', os.path.join(os.path.dirname(
+    os.path.realpath(__file__)), '..', '..', 'build'))
+
+extensions = [
+    Extension('stinger.stinger_cycore',
+        sources=['stinger/stinger_cycore.pyx'],
+        include_dirs=[os.path.join(build_dir, 'include'), np.get_include()],
+        library_dirs=[os.path.join(build_dir, 'lib')],
+        runtime_library_dirs=[os.path.join(build_dir, 'lib')],
+        libraries=['stinger_core'])
+]
+
+setup(
+    name='stinger',
+    packages=['stinger'],
+    ext_modules=cythonize(extensions),
+)
@@ -0,0 +1,137 @@
+from ctypes import *
+import os
+import threading
+
+import numpy as np
+
+from stinger_net import StingerEdgeUpdate
+
+# Same dlopen mode as stinger_core: global so cross-library symbols
+# resolve once, deep-bound so the OpenMP runtime is the library's own.
+_DLOPEN_MODE = RTLD_GLOBAL | getattr(os, 'RTLD_DEEPBIND', 0x8)
+
+if(os.getenv('STINGER_LIB_PATH')):
+  libstinger_alg = CDLL(os.getenv('STINGER_LIB_PATH') + '/libstinger_alg.so', mode=_DLOPEN_MODE)
+else:
+  libstinger_alg = CDLL('libstinger_alg.so', mode=_DLOPEN_MODE)
+
+class StingerSccStats(Structure):
+  _fields_ = [("bfs_deletes_in_tree", c_uint64),
+	      ("bfs_inserts_in_tree_as_parents", c_uint64),
+	      ("bfs_inserts_in_tree_as_neighbors", c_uint64),
+	      ("bfs_inserts_in_tree_as_replacement", c_uint64),
+	      ("bfs_inserts_bridged", c_uint64),
+	      ("bfs_unsafe_deletes", c_uint64)]
+
+# Bind symbols once with explicit argtypes/restype, as in stinger_core.
+# The internals are kept behind an opaque heap handle so no struct is
+# marshalled across the boundary per batch.
+_SIGS = {
+  'stinger_scc_internals_new':        ([c_void_p, c_int64, c_int64], c_void_p),
+  'stinger_scc_internals_free':       ([POINTER(c_void_p)], None),
+  'stinger_scc_reset_stats':          ([POINTER(StingerSccStats)], None),
+  'stinger_scc_insertion_batch':      ([c_void_p, c_int64, c_void_p, POINTER(StingerSccStats), POINTER(StingerEdgeUpdate), c_int64], c_int),
+  'stinger_scc_deletion_batch':       ([c_void_p, c_int64, c_void_p, POINTER(StingerSccStats), POINTER(StingerEdgeUpdate), c_int64], c_int),
+  'stinger_scc_internals_copy_component_array': ([c_void_p, POINTER(c_int64)], None),
+}
+
+for _name in _SIGS:
+  _fn = libstinger_alg[_name]
+  _fn.argtypes, _fn.restype = _SIGS[_name]
+  globals()['_' + _name] = _fn
+
+# Streaming updates push a batch every few milliseconds; allocating a
+# fresh ctypes array each time costs a type instantiation plus zeroing.
+# Keep one scratch buffer per thread and grow it geometrically.
+_tls = threading.local()
+
+def edge_update_batch(etypes, sources, destinations, weights, ts):
+  """Fill a reusable thread-local StingerEdgeUpdate array from columns.
+
+  All five arguments are indexable int64 columns of equal length.
+  Returns (buffer, count); the buffer may be longer than count and is
+  only valid on the calling thread until its next edge_update_batch
+  call.
+  """
+  n = len(sources)
+  if n > getattr(_tls, 'cap', 0):
+    _tls.cap = max(n, 2 * getattr(_tls, 'cap', 0))
+    _tls.buf = (StingerEdgeUpdate * _tls.cap)()
+  buf = _tls.buf
+  for i in xrange(n):
+    rec = buf[i]
+    rec.etype = etypes[i]
+    rec.etype_str = None
+    rec.source = sources[i]
+    rec.source_str = None
+    rec.destination = destinations[i]
+    rec.destination_str = None
+    rec.weight = weights[i]
+    rec.time = ts[i]
+    rec.result = 0
+    rec.meta_index = 0
+  return buf, n
+
+class StingerScc:
+  """Streaming connected components over a Stinger graph.
+
+  Wraps the opaque-handle SCC API: the C internals live on the heap and
+  only the handle crosses the boundary, so per-batch calls marshal a
+  pointer instead of the full internals struct.
+  """
+  def __init__(self, stinger, nv, parents_per_vertex=4):
+    self.stinger = stinger
+    # Pin the graph: Stinger.close() defers the free until we release,
+    # so the C internals never outlive the graph they index.
+    stinger._retain()
+    self.nv = nv
+    self.parents_per_vertex = parents_per_vertex
+    self.internal = c_void_p(_stinger_scc_internals_new(stinger.raw(), nv, parents_per_vertex))
+    self.stats = StingerSccStats()
+    # The C entry point picks an insertion kernel specialized for the
+    # common parents_per_vertex values (4 and 8); bind it once here so a
+    # different dispatch can be swapped in without touching insertion().
+    self._insert_fn = _stinger_scc_insertion_batch
+
+  def __del__(self):
+    # Defensive: interpreter teardown may have dropped attributes.
+    try:
+      self.release()
+    except AttributeError:
+      pass
+
+  def release(self):
+    if(self.internal):
+      _stinger_scc_internals_free(byref(self.internal))
+      self.internal = None
+      self.stinger._release()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.release()
+
+  def reset_stats(self):
+    _stinger_scc_reset_stats(byref(self.stats))
+
+  def insertion(self, batch, batch_size=None):
+    if batch_size is None:
+      batch_size = len(batch)
+    return self._insert_fn(self.stinger.raw(), self.nv,
+	self.internal, byref(self.stats), batch, batch_size)
+
+  def deletion(self, batch, batch_size=None):
+    if batch_size is None:
+      batch_size = len(batch)
+    return _stinger_scc_deletion_batch(self.stinger.raw(), self.nv,
+	self.internal, byref(self.stats), batch, batch_size)
+
+  def components(self):
+    out = np.empty(self.nv, dtype=np.int64)
+    _stinger_scc_internals_copy_component_array(self.internal,
+	out.ctypes.data_as(POINTER(c_int64)))
+    return out
+
+  def get_stats(self):
+    return dict((name, getattr(self.stats, name)) for name, _ in StingerSccStats._fields_)
@@ -1,92 +1,294 @@
 from ctypes import *
+import itertools
 import os
+import threading
+
+import numpy as np
+
+# RTLD_GLOBAL lets libstinger_alg/net resolve core symbols through this
+# handle; RTLD_DEEPBIND keeps the library bound to its own OpenMP runtime
+# if the process preloaded another one.  os only grew RTLD_DEEPBIND in
+# Python 3, so fall back to the glibc value.
+_DLOPEN_MODE = RTLD_GLOBAL | getattr(os, 'RTLD_DEEPBIND', 0x8)
 
 if(os.getenv('STINGER_LIB_PATH')):
-  libstinger_core = cdll.LoadLibrary(os.getenv('STINGER_LIB_PATH') + '/libstinger_core.so')
+  libstinger_core = CDLL(os.getenv('STINGER_LIB_PATH') + '/libstinger_core.so', mode=_DLOPEN_MODE)
 else:
-  libstinger_core = cdll.LoadLibrary('libstinger_core.so')
+  libstinger_core = CDLL('libstinger_core.so', mode=_DLOPEN_MODE)
+
+# Bind each C symbol once at import time with explicit argtypes/restype.
+# Indexing libstinger_core['name'] at each call site re-runs the symbol
+# lookup and leaves the default int restype, which truncates 64-bit
+# returns and makes ctypes re-check arguments on every call.
+_SIGS = {
+  'stinger_new':                     ([], c_void_p),
+  'stinger_free_all':                ([c_void_p], c_void_p),
+  'stinger_open_from_file':          ([c_char_p, c_void_p, POINTER(c_int64)], c_int),
+  'stinger_save_to_file':            ([c_void_p, c_int64, c_char_p], c_int),
+  'stinger_max_active_vertex':       ([c_void_p], c_int64),
+  'stinger_mapping_create':          ([c_void_p, c_char_p, c_int64, POINTER(c_int64)], c_int),
+  'stinger_mapping_create_batch':    ([c_void_p, c_char_p, POINTER(c_int64), c_int64, POINTER(c_int64)], c_int),
+  'stinger_mapping_lookup':          ([c_void_p, c_char_p, c_int64], c_int64),
+  'stinger_mapping_lookup_batch':    ([c_void_p, c_char_p, POINTER(c_int64), c_int64, POINTER(c_int64)], None),
+  'stinger_mapping_physid_direct':   ([c_void_p, c_int64, POINTER(c_char_p), POINTER(c_int64)], c_int),
+  'stinger_mapping_nv':              ([c_void_p], c_int64),
+  'stinger_vtype_names_create_type': ([c_void_p, c_char_p, POINTER(c_int64)], c_int),
+  'stinger_vtype_names_lookup_type': ([c_void_p, c_char_p], c_int64),
+  'stinger_vtype_names_lookup_name': ([c_void_p, c_int64], c_char_p),
+  'stinger_vtype_names_count':       ([c_void_p], c_int64),
+  'stinger_etype_names_create_type': ([c_void_p, c_char_p, POINTER(c_int64)], c_int),
+  'stinger_etype_names_lookup_type': ([c_void_p, c_char_p], c_int64),
+  'stinger_etype_names_lookup_name': ([c_void_p, c_int64], c_char_p),
+  'stinger_etype_names_count':       ([c_void_p], c_int64),
+  'stinger_insert_edge':             ([c_void_p, c_int64, c_int64, c_int64, c_int64, c_int64], c_int),
+  'stinger_insert_edge_pair':        ([c_void_p, c_int64, c_int64, c_int64, c_int64, c_int64], c_int),
+  'stinger_incr_edge':               ([c_void_p, c_int64, c_int64, c_int64, c_int64, c_int64], c_int),
+  'stinger_incr_edge_pair':          ([c_void_p, c_int64, c_int64, c_int64, c_int64, c_int64], c_int),
+  'stinger_insert_edges':            ([c_void_p, POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), c_int64], c_int),
+  'stinger_insert_edge_pairs':       ([c_void_p, POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), c_int64], c_int),
+  'stinger_ingest_named_edges':      ([c_void_p, c_char_p, POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), c_int64], c_int),
+  'stinger_remove_edge':             ([c_void_p, c_int64, c_int64, c_int64], c_int),
+  'stinger_remove_edge_pair':        ([c_void_p, c_int64, c_int64, c_int64], c_int),
+  'stinger_remove_edges':            ([c_void_p, POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), c_int64], c_int64),
+  'stinger_remove_edge_pairs':       ([c_void_p, POINTER(c_int64), POINTER(c_int64), POINTER(c_int64), c_int64], c_int64),
+  'stinger_indegree_get':            ([c_void_p, c_int64], c_int64),
+  'stinger_outdegree_get':           ([c_void_p, c_int64], c_int64),
+  'stinger_vtype_get':               ([c_void_p, c_int64], c_int64),
+  'stinger_vtype_set':               ([c_void_p, c_int64, c_int64], c_int64),
+  'stinger_vweight_get':             ([c_void_p, c_int64], c_int64),
+  'stinger_vweight_set':             ([c_void_p, c_int64, c_int64], c_int64),
+  'stinger_vweight_increment':       ([c_void_p, c_int64, c_int64], c_int64),
+  'stinger_gather_successors':       ([c_void_p, c_int64, c_void_p, c_void_p, c_void_p, c_void_p, c_void_p, c_void_p, c_int64], None),
+  'stinger_gather_successors_range': ([c_void_p, c_int64, c_int64, c_void_p, c_void_p, c_void_p, c_void_p, c_void_p, c_void_p, c_int64], None),
+}
+
+for _name in _SIGS:
+  _fn = libstinger_core[_name]
+  _fn.argtypes, _fn.restype = _SIGS[_name]
+  globals()['_' + _name] = _fn
+
+def _to_bytes(name):
+  # Encode string arguments once at the boundary; with c_char_p argtypes
+  # the bytes object is then passed straight through with no per-call
+  # copy or re-encoding.
+  if isinstance(name, unicode):
+    return name.encode('utf-8')
+  return name
+
+# Row layouts returned by Stinger.edges_of: all-int64 when the caller
+# passed a vertex id, object columns for the resolved names otherwise.
+EDGE_DTYPE = np.dtype([('etype', np.int64), ('source', np.int64),
+    ('neighbor', np.int64), ('weight', np.int64),
+    ('timefirst', np.int64), ('timerecent', np.int64)])
+EDGE_NAME_DTYPE = np.dtype([('etype', object), ('source', object),
+    ('neighbor', object), ('weight', np.int64),
+    ('timefirst', np.int64), ('timerecent', np.int64)])
 
 class Stinger:
   def __init__(self, s=None, filename=None):
+    self._name_cache = {}
+    self._refs = 0
+    self._close_pending = False
+    # High-water mark of vertices touched by edge inserts, so periodic
+    # save_to_file calls skip the O(nv) C scan; seeded from the C scan
+    # when loading an existing graph.
+    self._max_vtx = -1
     if(filename != None):
-      self.s = c_void_p(0)
-      nv = c_int64(0)
-      libstinger_core['stinger_open_from_file'](c_char_p(filename), c_void_p(addressof(self.s)), 
-	  c_void_p(addressof(nv)))
+      # stinger_open_from_file() loads into an already-allocated graph
+      # and reports the saved vertex count through its out-parameter.
+      self.s = c_void_p(_stinger_new())
       self.free = True
+      nv = c_int64()
+      if _stinger_open_from_file(_to_bytes(filename), self.s, byref(nv)) != 0:
+        self.close()
+        raise IOError("could not load STINGER graph from '%s'" % filename)
+      self._max_vtx = nv.value - 1
     elif(None == s):
-      stinger_new = libstinger_core['stinger_new']
-      stinger_new.restype = c_void_p
       self.free = True
-      self.s = c_void_p(stinger_new())
+      self.s = c_void_p(_stinger_new())
     else:
       self.free = False
       self.s = c_void_p(s)
 
   def __del__(self):
-    if(self.free):
-      stinger_free_all = libstinger_core['stinger_free_all']
-      stinger_free_all.restype = c_void_p
-      self.s = stinger_free_all(self.s)
+    # Defensive: __del__ can run mid-teardown with attributes already
+    # gone, and must never free while a wrapper still holds the graph.
+    try:
+      self.close()
+    except AttributeError:
+      pass
+
+  def close(self):
+    """Free the underlying graph if owned and no wrapper still uses it.
+
+    Wrappers that keep the raw pointer (e.g. StingerScc) register via
+    _retain/_release; while any are live the free is deferred until the
+    last one releases.  Safe to call more than once, and also available
+    as context-manager exit.
+    """
+    if self._refs > 0:
+      self._close_pending = True
+      return
+    if self.free and self.s:
+      self.s = _stinger_free_all(self.s)
+      self.free = False
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.close()
+
+  def _retain(self):
+    self._refs += 1
+
+  def _release(self):
+    self._refs -= 1
+    if self._refs <= 0 and self._close_pending:
+      self.close()
 
   def raw(self):
     return self.s
 
   def save_to_file(self, filename):
-    libstinger_core['stinger_save_to_file'](self.s, 1+self.max_active_vtx(), c_char_p(filename))
+    # A graph wrapped around a raw pointer may gain edges behind our
+    # back, so only trust the Python-side high-water mark when we own it.
+    if self.free:
+      _stinger_save_to_file(self.s, 1+self._max_vtx, _to_bytes(filename))
+    else:
+      _stinger_save_to_file(self.s, 1+self.max_active_vtx(), _to_bytes(filename))
 
   def max_active_vtx(self):
-    return libstinger_core['stinger_max_active_vertex'](self.s)
+    return _stinger_max_active_vertex(self.s)
 
   def create_mapping(self, name):
+    name = _to_bytes(name)
     vtx_out = c_int64(0)
-    libstinger_core['stinger_mapping_create'](self.s, c_char_p(name), len(name), c_void_p(addressof(vtx_out)))
+    _stinger_mapping_create(self.s, name, len(name), byref(vtx_out))
     return vtx_out.value
 
+  def create_mappings(self, names):
+    """Map a batch of vertex names to ids with one C call.
+
+    names is a sequence of strings; returns an int64 NumPy array of
+    vertex ids, one per name.  The names are packed into a single
+    NUL-separated buffer plus an offsets array, so the per-name call
+    overhead is paid once per batch instead of once per name.
+    """
+    buf, offsets, n = self._pack_names(names)
+    out = np.empty(n, dtype=np.int64)
+    _stinger_mapping_create_batch(self.s, buf,
+	offsets.ctypes.data_as(POINTER(c_int64)), n,
+	out.ctypes.data_as(POINTER(c_int64)))
+    return out
+
+  def get_mappings(self, names):
+    """Look up a batch of vertex names with one C call.
+
+    Returns an int64 NumPy array of vertex ids; names that have never
+    been mapped come back as -1.  Unlike create_mappings this never
+    creates new vertices.
+    """
+    buf, offsets, n = self._pack_names(names)
+    out = np.empty(n, dtype=np.int64)
+    _stinger_mapping_lookup_batch(self.s, buf,
+	offsets.ctypes.data_as(POINTER(c_int64)), n,
+	out.ctypes.data_as(POINTER(c_int64)))
+    return out
+
+  def _pack_names(self, names):
+    names = [n.encode('utf-8') if isinstance(n, unicode) else n for n in names]
+    buf = b'\0'.join(names) + b'\0'
+    offsets = np.cumsum([0] + [len(s) + 1 for s in names]).astype(np.int64)
+    return buf, offsets, len(names)
+
+  def _cached_name(self, vtx):
+    # Vertex names never change once mapped, so memoize lookups; the
+    # cache is cleared wholesale if it ever grows unreasonably large.
+    cache = self._name_cache
+    name = cache.get(vtx)
+    if name is None:
+      if len(cache) >= 1048576:
+        cache.clear()
+      name = self.get_name(vtx)
+      cache[vtx] = name
+    return name
+
   def get_mapping(self, name):
-    return libstinger_core['stinger_mapping_lookup'](self.s, c_char_p(name), len(name))
+    name = _to_bytes(name)
+    return _stinger_mapping_lookup(self.s, name, len(name))
 
   def get_name(self, vtx):
-    name = c_char_p(0)
-    length = c_int64(0)
-    libstinger_core['stinger_mapping_physid_direct'](self.s, c_int64(vtx), c_void_p(addressof(name)), c_void_p(addressof(length)))
-    rtn = str(name.value[:length.value])
-    return rtn
-  
+    name = c_char_p()
+    length = c_int64()
+    _stinger_mapping_physid_direct(self.s, vtx, byref(name), byref(length))
+    # One copy of exactly length bytes; name.value would scan to the
+    # first NUL and copy twice, corrupting names with embedded NULs.
+    return string_at(name, length.value)
+
   def mapping_nv(self):
-    return libstinger_core['stinger_mapping_nv'](self.s)
+    return _stinger_mapping_nv(self.s)
 
   def create_vtype(self, name):
     vtx_out = c_int64(0)
-    libstinger_core['stinger_vtype_names_create_type'](self.s, c_char_p(name), c_void_p(addressof(vtx_out)))
+    _stinger_vtype_names_create_type(self.s, _to_bytes(name), byref(vtx_out))
     return vtx_out.value
 
   def get_vtype(self, name):
-    return libstinger_core['stinger_vtype_names_lookup_type'](self.s, c_char_p(name))
+    return _stinger_vtype_names_lookup_type(self.s, _to_bytes(name))
 
   def get_vtype_name(self, vtype):
-    lookup_name = libstinger_core['stinger_vtype_names_lookup_name']
-    lookup_name.restype = c_char_p
-    return lookup_name(self.s, c_int64(vtype))
+    return _stinger_vtype_names_lookup_name(self.s, vtype)
 
   def num_vtypes(self):
-    return libstinger_core['stinger_vtype_names_count'](self.s)
+    return _stinger_vtype_names_count(self.s)
 
   def create_etype(self, name):
     vtx_out = c_int64(0)
-    libstinger_core['stinger_etype_names_create_type'](self.s, c_char_p(name), c_void_p(addressof(vtx_out)))
+    _stinger_etype_names_create_type(self.s, _to_bytes(name), byref(vtx_out))
     return vtx_out.value
 
   def get_etype(self, name):
-    return libstinger_core['stinger_etype_names_lookup_type'](self.s, c_char_p(name))
+    return _stinger_etype_names_lookup_type(self.s, _to_bytes(name))
 
   def get_etype_name(self, etype):
-    lookup_name = libstinger_core['stinger_etype_names_lookup_name']
-    lookup_name.restype = c_char_p
-    return lookup_name(self.s, c_int64(etype))
+    return _stinger_etype_names_lookup_name(self.s, etype)
 
   def num_etypes(self):
-    return libstinger_core['stinger_etype_names_count'](self.s)
+    return _stinger_etype_names_count(self.s)
+
+  # The *_ids variants take pre-resolved integer ids and skip the
+  # per-call isinstance dispatch; bulk callers that already know their
+  # types should use them directly.
+  def insert_edge_ids(self, vfrom, vto, etype=0, weight=1, ts=1):
+    self._note_vertices(vfrom, vto)
+    _stinger_insert_edge(self.s, etype, vfrom, vto, weight, ts)
+
+  def insert_edge_pair_ids(self, vfrom, vto, etype=0, weight=1, ts=1):
+    self._note_vertices(vfrom, vto)
+    _stinger_insert_edge_pair(self.s, etype, vfrom, vto, weight, ts)
+
+  def increment_edge_ids(self, vfrom, vto, etype=0, weight=1, ts=1):
+    self._note_vertices(vfrom, vto)
+    _stinger_incr_edge(self.s, etype, vfrom, vto, weight, ts)
+
+  def increment_edge_pair_ids(self, vfrom, vto, etype=0, weight=1, ts=1):
+    self._note_vertices(vfrom, vto)
+    _stinger_incr_edge_pair(self.s, etype, vfrom, vto, weight, ts)
+
+  def _note_vertices(self, vfrom, vto):
+    if vfrom > self._max_vtx:
+      self._max_vtx = vfrom
+    if vto > self._max_vtx:
+      self._max_vtx = vto
+
+  def remove_edge_ids(self, vfrom, vto, etype=0):
+    if (vfrom > 0) and (vto > 0):
+      _stinger_remove_edge(self.s, etype, vfrom, vto)
+
+  def remove_edge_pair_ids(self, vfrom, vto, etype=0):
+    if (vfrom > 0) and (vto > 0):
+      _stinger_remove_edge_pair(self.s, etype, vfrom, vto)
 
   def insert_edge(self, vfrom, vto, etype=0, weight=1, ts=1):
     if isinstance(vfrom, basestring):
@@ -95,8 +297,7 @@ class Stinger:
       vto = self.create_mapping(vto)
     if isinstance(etype, basestring):
       etype = self.create_etype(etype)
-    libstinger_core['stinger_insert_edge'](self.s, c_int64(etype), c_int64(vfrom), 
-	c_int64(vto), c_int64(weight), c_int64(ts))
+    self.insert_edge_ids(vfrom, vto, etype, weight, ts)
 
   def insert_edge_pair(self, vfrom, vto, etype=0, weight=1, ts=1):
     if isinstance(vfrom, basestring):
@@ -105,8 +306,94 @@ class Stinger:
       vto = self.create_mapping(vto)
     if isinstance(etype, basestring):
       etype = self.create_etype(etype)
-    libstinger_core['stinger_insert_edge_pair'](self.s, c_int64(etype), c_int64(vfrom), 
-	c_int64(vto), c_int64(weight), c_int64(ts))
+    self.insert_edge_pair_ids(vfrom, vto, etype, weight, ts)
+
+  def insert_edges(self, vfroms, vtos, etypes=None, weights=None, ts=None, directed=True, threads=1):
+    """Insert a batch of edges with one C call.
+
+    vfroms and vtos are array-likes of pre-mapped int64 vertex ids (use
+    create_mapping / create_mappings to resolve names first); etypes,
+    weights and ts may be scalars, array-likes or None for the same
+    defaults as insert_edge.  The C loop runs in parallel under OpenMP,
+    so the per-edge Python and ctypes overhead is paid once per batch.
+
+    All arguments to the C call are primitives, so ctypes releases the
+    GIL for its duration: other Python threads keep running, and with
+    threads > 1 the batch is split across that many Python threads each
+    driving its own slice (useful when libstinger_core was built without
+    OpenMP; the C insert path itself is safe for concurrent updates).
+    """
+    vfroms = np.ascontiguousarray(vfroms, dtype=np.int64)
+    vtos = np.ascontiguousarray(vtos, dtype=np.int64)
+    n = vfroms.shape[0]
+    if n:
+      self._note_vertices(int(vfroms.max()), int(vtos.max()))
+    etypes = self._edge_column(etypes, 0, n)
+    weights = self._edge_column(weights, 1, n)
+    ts = self._edge_column(ts, 1, n)
+    fn = _stinger_insert_edges if directed else _stinger_insert_edge_pairs
+
+    def call(lo, hi):
+      return fn(self.s,
+	  etypes[lo:hi].ctypes.data_as(POINTER(c_int64)),
+	  vfroms[lo:hi].ctypes.data_as(POINTER(c_int64)),
+	  vtos[lo:hi].ctypes.data_as(POINTER(c_int64)),
+	  weights[lo:hi].ctypes.data_as(POINTER(c_int64)),
+	  ts[lo:hi].ctypes.data_as(POINTER(c_int64)),
+	  hi - lo)
+
+    if threads <= 1 or n < threads:
+      return call(0, n)
+
+    results = []
+    def worker(lo, hi):
+      results.append(call(lo, hi))
+
+    workers = [threading.Thread(target=worker, args=(i * n // threads, (i + 1) * n // threads))
+	for i in range(threads)]
+    for w in workers:
+      w.start()
+    for w in workers:
+      w.join()
+    return -1 if any(r < 0 for r in results) else 0
+
+  def insert_edge_pairs(self, vfroms, vtos, etypes=None, weights=None, ts=None):
+    return self.insert_edges(vfroms, vtos, etypes, weights, ts, directed=False)
+
+  def ingest_named_edges(self, from_names, to_names, etypes=None, weights=None, ts=None):
+    """Map endpoint names and insert undirected edges with one C call.
+
+    The per-row ingest loop pays three boundary crossings per edge (two
+    create_mapping calls plus insert_edge_pair); this packs both name
+    columns into one NUL-separated buffer and lets C run the mapping
+    creates and inserts in a single OpenMP loop.  etypes, weights and
+    ts accept scalars, array-likes or None as in insert_edges.
+    """
+    n = len(from_names)
+    buf, offsets, _ = self._pack_names(list(from_names) + list(to_names))
+    from_off = offsets[:n]
+    to_off = offsets[n:2 * n]
+    etypes = self._edge_column(etypes, 0, n)
+    weights = self._edge_column(weights, 1, n)
+    ts = self._edge_column(ts, 1, n)
+    rtn = _stinger_ingest_named_edges(self.s, buf,
+	from_off.ctypes.data_as(POINTER(c_int64)),
+	to_off.ctypes.data_as(POINTER(c_int64)),
+	etypes.ctypes.data_as(POINTER(c_int64)),
+	weights.ctypes.data_as(POINTER(c_int64)),
+	ts.ctypes.data_as(POINTER(c_int64)),
+	n)
+    # Mapped ids are allocated densely, so the mapping count bounds the
+    # new high-water mark without a vertex scan.
+    self._note_vertices(self.mapping_nv() - 1, 0)
+    return rtn
+
+  def _edge_column(self, col, default, n):
+    if col is None:
+      col = default
+    if np.isscalar(col):
+      return np.full(n, col, dtype=np.int64)
+    return np.ascontiguousarray(col, dtype=np.int64)
 
   def increment_edge(self, vfrom, vto, etype=0, weight=1, ts=1):
     if isinstance(vfrom, basestring):
@@ -115,8 +402,7 @@ class Stinger:
       vto = self.create_mapping(vto)
     if isinstance(etype, basestring):
       etype = self.create_etype(etype)
-    libstinger_core['stinger_incr_edge'](self.s, c_int64(etype), c_int64(vfrom), 
-	c_int64(vto), c_int64(weight), c_int64(ts))
+    self.increment_edge_ids(vfrom, vto, etype, weight, ts)
 
   def increment_edge_pair(self, vfrom, vto, etype=0, weight=1, ts=1):
     if isinstance(vfrom, basestring):
@@ -125,8 +411,7 @@ class Stinger:
       vto = self.create_mapping(vto)
     if isinstance(etype, basestring):
       etype = self.create_etype(etype)
-    libstinger_core['stinger_incr_edge_pair'](self.s, c_int64(etype), c_int64(vfrom), 
-	c_int64(vto), c_int64(weight), c_int64(ts))
+    self.increment_edge_pair_ids(vfrom, vto, etype, weight, ts)
 
   def remove_edge(self, vfrom, vto, etype=0):
     if isinstance(vfrom, basestring):
@@ -135,9 +420,7 @@ class Stinger:
       vto = self.get_mapping(vto)
     if isinstance(etype, basestring):
       etype = self.create_etype(etype)
-    if (vfrom > 0) and (vto > 0):
-      libstinger_core['stinger_remove_edge'](self.s, c_int64(etype), c_int64(vfrom), 
-	  c_int64(vto))
+    self.remove_edge_ids(vfrom, vto, etype)
 
   def remove_edge_pair(self, vfrom, vto, etype=0):
     if isinstance(vfrom, basestring):
@@ -146,87 +429,212 @@ class Stinger:
       vto = self.get_mapping(vto)
     if isinstance(etype, basestring):
       etype = self.create_etype(etype)
-    if (vfrom > 0) and (vto > 0):
-      libstinger_core['stinger_remove_edge_pair'](self.s, c_int64(etype), c_int64(vfrom), 
-	  c_int64(vto))
+    self.remove_edge_pair_ids(vfrom, vto, etype)
+
+  def remove_edges(self, vfroms, vtos, etypes=None, directed=True):
+    """Remove a batch of edges with one C call.
+
+    vfroms and vtos are sequences of vertex names or of pre-mapped
+    int64 ids; etypes may be a scalar or array-like as in insert_edges.
+    Name batches are resolved with get_mappings, pairs with an unmapped
+    endpoint are dropped (matching the guard in remove_edge_ids) and
+    duplicate (etype, from, to) triples are collapsed so each edge is
+    removed at most once.  Returns the number of edges the C side
+    actually removed.
+    """
+    if len(vfroms) and isinstance(vfroms[0], basestring):
+      vfroms = self.get_mappings(vfroms)
+    else:
+      vfroms = np.ascontiguousarray(vfroms, dtype=np.int64)
+    if len(vtos) and isinstance(vtos[0], basestring):
+      vtos = self.get_mappings(vtos)
+    else:
+      vtos = np.ascontiguousarray(vtos, dtype=np.int64)
+    n = vfroms.shape[0]
+    etypes = self._edge_column(etypes, 0, n)
+
+    mask = (vfroms > 0) & (vtos > 0)
+    if not mask.any():
+      # np.unique(..., axis=0) rejects an empty selection, which is
+      # reachable with valid input (every endpoint unmapped or dropped
+      # by the guard), so bail out before it.
+      return 0
+    triples = np.unique(np.column_stack((etypes, vfroms, vtos))[mask], axis=0)
+    count = triples.shape[0]
+    etypes = np.ascontiguousarray(triples[:, 0])
+    vfroms = np.ascontiguousarray(triples[:, 1])
+    vtos = np.ascontiguousarray(triples[:, 2])
+    fn = _stinger_remove_edges if directed else _stinger_remove_edge_pairs
+    return fn(self.s,
+	etypes.ctypes.data_as(POINTER(c_int64)),
+	vfroms.ctypes.data_as(POINTER(c_int64)),
+	vtos.ctypes.data_as(POINTER(c_int64)),
+	count)
 
   def indegree(self, vtx):
     if isinstance(vtx, basestring):
       vtx = self.get_mapping(vtx)
-    return libstinger_core['stinger_indegree_get'](self.s, c_int64(vtx))
+    return _stinger_indegree_get(self.s, vtx)
 
   def outdegree(self, vtx):
     if isinstance(vtx, basestring):
       vtx = self.get_mapping(vtx)
-    return libstinger_core['stinger_outdegree_get'](self.s, c_int64(vtx))
+    return _stinger_outdegree_get(self.s, vtx)
 
   def get_type(self, vtx):
     if isinstance(vtx, basestring):
       vtx = self.get_mapping(vtx)
-    return libstinger_core['stinger_vtype_get'](self.s, c_int64(vtx))
+    return _stinger_vtype_get(self.s, vtx)
 
   def set_vtype(self, vtx, vtype):
     if isinstance(vtx, basestring):
       vtx = self.get_mapping(vtx)
     if isinstance(vtype, basestring):
       vtype = self.create_vtype(vtype)
-    return libstinger_core['stinger_vtype_set'](self.s, c_int64(vtx), c_int64(vtype))
+    return _stinger_vtype_set(self.s, vtx, vtype)
 
   def get_vweight(self, vtx):
     if isinstance(vtx, basestring):
       vtx = self.get_mapping(vtx)
-    return libstinger_core['stinger_vweight_get'](self.s, c_int64(vtx))
+    return _stinger_vweight_get(self.s, vtx)
 
   def set_vweight(self, vtx, vweight):
     if isinstance(vtx, basestring):
       vtx = self.get_mapping(vtx)
-    return libstinger_core['stinger_vweight_set'](self.s, c_int64(vtx), c_int64(vweight))
+    return _stinger_vweight_set(self.s, vtx, vweight)
 
   def increment_vweight(self, vtx, vweight):
     if isinstance(vtx, basestring):
       vtx = self.get_mapping(vtx)
-    return libstinger_core['stinger_vweight_increment'](self.s, c_int64(vtx), c_int64(vweight))
+    return _stinger_vweight_increment(self.s, vtx, vweight)
 
-  def edges_of(self, vtx):
+  def neighbors_of(self, vtx):
+    """Return only the successor ids of vtx as an int64 NumPy array.
+
+    The weight/timestamp/etype buffers of the C gather are optional, so
+    this passes NULL for all four and touches a fifth of the memory
+    edges_of does.  Use it when the metadata columns are not needed.
+    """
     if isinstance(vtx, basestring):
-      vtx_name = vtx
       vtx = self.get_mapping(vtx)
 
-      deg = self.outdegree(vtx)
-
-      outlen = (c_int64 * 1)()
-      arr_type = c_int64 * deg
+    deg = self.outdegree(vtx)
 
-      source = [vtx_name] * deg
-      neighbor = arr_type()
-      weight = arr_type()
-      timefirst = arr_type()
-      timerecent = arr_type()
-      etype = arr_type()
+    outlen = (c_int64 * 1)()
+    neighbor = np.empty(deg, dtype=np.int64)
 
-      libstinger_core['stinger_gather_successors'](self.s, c_int64(vtx),
-	  outlen, neighbor, weight, timefirst, timerecent, etype, c_int64(deg))
+    _stinger_gather_successors(self.s, vtx,
+	outlen, neighbor.ctypes.data, None, None, None, None, deg)
 
-      neighbor = [self.get_name(v) for v in neighbor]
+    return neighbor[:outlen[0]]
 
+  def edges_of(self, vtx):
+    """Return the edges of vtx as a NumPy structured array.
+
+    The fields are etype, source, neighbor, weight, timefirst and
+    timerecent.  With an integer vtx all fields are int64 and the
+    metadata columns come straight out of the gather buffers, so
+    downstream analytics can run vectorized on the columns instead of
+    reboxing tuples; with a vertex name the etype, source and neighbor
+    fields hold the resolved names.  edges_of_tuples keeps the old
+    per-edge tuple iterator.
+    """
+    if isinstance(vtx, basestring):
+      source = vtx
+      vtx = self.get_mapping(vtx)
+      strings = True
+    else:
+      source = vtx
+      strings = False
+
+    deg = self.outdegree(vtx)
+
+    # Gather directly into NumPy buffers; the C side fills them in place,
+    # so no per-element ctypes boxing happens.
+    outlen = (c_int64 * 1)()
+    neighbor = np.empty(deg, dtype=np.int64)
+    weight = np.empty(deg, dtype=np.int64)
+    timefirst = np.empty(deg, dtype=np.int64)
+    timerecent = np.empty(deg, dtype=np.int64)
+    etype = np.empty(deg, dtype=np.int64)
+
+    _stinger_gather_successors(self.s, vtx,
+	outlen, neighbor.ctypes.data, weight.ctypes.data,
+	timefirst.ctypes.data, timerecent.ctypes.data, etype.ctypes.data, deg)
+    got = outlen[0]
+
+    out = np.empty(got, dtype=EDGE_NAME_DTYPE if strings else EDGE_DTYPE)
+    if strings:
+      # At most num_etypes() distinct names exist, so resolve each id once
+      # up front instead of making one C call per edge.
       max_etypes = self.num_etypes()
-      etype = [self.get_etype_name(t) if t < max_etypes else t for t in etype]
-
-      return zip(etype, source, neighbor, weight, timefirst, timerecent)
+      etype_names = [self.get_etype_name(i) for i in range(max_etypes)]
+      out['etype'] = [etype_names[t] if t < max_etypes else t
+	  for t in etype[:got]]
+      out['neighbor'] = [self._cached_name(n) for n in neighbor[:got]]
     else:
-      deg = self.outdegree(vtx)
-
-      outlen = (c_int64 * 1)()
-      arr_type = c_int64 * deg
-
-      source = [vtx] * deg
-      neighbor = arr_type()
-      weight = arr_type()
-      timefirst = arr_type()
-      timerecent = arr_type()
-      etype = arr_type()
-
-      libstinger_core['stinger_gather_successors'](self.s, c_int64(vtx),
-	  outlen, neighbor, weight, timefirst, timerecent, etype, c_int64(deg))
-
-      return zip(etype, source, neighbor, weight, timefirst, timerecent)
+      out['etype'] = etype[:got]
+      out['neighbor'] = neighbor[:got]
+    out['source'] = source
+    out['weight'] = weight[:got]
+    out['timefirst'] = timefirst[:got]
+    out['timerecent'] = timerecent[:got]
+    return out
+
+  def edges_of_tuples(self, vtx):
+    """Iterate (etype, source, neighbor, weight, timefirst, timerecent)
+    tuples; the pre-structured-array form of edges_of."""
+    e = self.edges_of(vtx)
+    return itertools.izip(e['etype'], e['source'], e['neighbor'],
+	e['weight'], e['timefirst'], e['timerecent'])
+
+  def iter_edges_of(self, vtx, chunk=8192):
+    """Iterate over the edges of vtx, gathering in cache-sized chunks.
+
+    edges_of allocates five deg-sized columns up front, which for
+    high-degree hubs evicts each entry from cache long before the
+    per-edge Python work touches it.  This generator gathers chunk
+    edges at a time into reused buffers (8192 edges is about 320 KiB
+    across the five columns) so the decode runs while the data is
+    still hot, and peak memory stays constant regardless of degree.
+    Yields the same tuples as edges_of.
+    """
+    if isinstance(vtx, basestring):
+      source = vtx
+      vtx = self.get_mapping(vtx)
+      strings = True
+      max_etypes = self.num_etypes()
+      etype_names = [self.get_etype_name(i) for i in range(max_etypes)]
+    else:
+      source = vtx
+      strings = False
+
+    deg = self.outdegree(vtx)
+    chunk = min(chunk, deg) if deg else 0
+
+    outlen = (c_int64 * 1)()
+    neighbor = np.empty(chunk, dtype=np.int64)
+    weight = np.empty(chunk, dtype=np.int64)
+    timefirst = np.empty(chunk, dtype=np.int64)
+    timerecent = np.empty(chunk, dtype=np.int64)
+    etype = np.empty(chunk, dtype=np.int64)
+
+    off = 0
+    while off < deg:
+      _stinger_gather_successors_range(self.s, vtx, off,
+	  outlen, neighbor.ctypes.data, weight.ctypes.data,
+	  timefirst.ctypes.data, timerecent.ctypes.data, etype.ctypes.data,
+	  chunk)
+      got = outlen[0]
+      if got <= 0:
+        break
+      for i in xrange(got):
+        t = etype[i]
+        if strings:
+          yield (etype_names[t] if t < max_etypes else t, source,
+              self._cached_name(neighbor[i]), weight[i], timefirst[i],
+              timerecent[i])
+        else:
+          yield (t, source, neighbor[i], weight[i], timefirst[i],
+              timerecent[i])
+      off += got
@@ -0,0 +1,152 @@
+# Optional Cython build of the hot-path Stinger bindings.
+#
+# This mirrors the per-edge subset of stinger_core.Stinger (mappings,
+# edge insertion/removal, degrees, neighbor gathering) as a cdef class
+# calling the C prototypes directly, so no ctypes marshalling happens at
+# call time.  Build it with src/py/setup.py against an existing STINGER
+# build; the pure-ctypes stinger_core module remains the portable path.
+
+from libc.stdint cimport int64_t, uint64_t
+
+import numpy as np
+cimport numpy as cnp
+
+cnp.import_array()
+
+cdef extern from "stinger_core/stinger.h":
+    struct stinger:
+        pass
+
+    stinger * stinger_new() nogil
+    stinger * stinger_free_all(stinger *) nogil
+
+    int stinger_mapping_create(stinger *, const char *, uint64_t, int64_t *) nogil
+    int64_t stinger_mapping_lookup(stinger *, const char *, uint64_t) nogil
+    int stinger_mapping_create_batch(stinger *, const char *, const int64_t *, int64_t, int64_t *) nogil
+    int64_t stinger_mapping_nv(stinger *) nogil
+
+    int stinger_insert_edge(stinger *, int64_t, int64_t, int64_t, int64_t, int64_t) nogil
+    int stinger_insert_edge_pair(stinger *, int64_t, int64_t, int64_t, int64_t, int64_t) nogil
+    int stinger_incr_edge(stinger *, int64_t, int64_t, int64_t, int64_t, int64_t) nogil
+    int stinger_incr_edge_pair(stinger *, int64_t, int64_t, int64_t, int64_t, int64_t) nogil
+    int stinger_remove_edge(stinger *, int64_t, int64_t, int64_t) nogil
+    int stinger_remove_edge_pair(stinger *, int64_t, int64_t, int64_t) nogil
+    int stinger_insert_edges(stinger *, const int64_t *, const int64_t *, const int64_t *, const int64_t *, const int64_t *, int64_t) nogil
+    int stinger_insert_edge_pairs(stinger *, const int64_t *, const int64_t *, const int64_t *, const int64_t *, const int64_t *, int64_t) nogil
+
+    int64_t stinger_indegree_get(stinger *, int64_t) nogil
+    int64_t stinger_outdegree_get(stinger *, int64_t) nogil
+
+    void stinger_gather_successors(stinger *, int64_t, size_t *, int64_t *,
+                                   int64_t *, int64_t *, int64_t *, int64_t *,
+                                   size_t) nogil
+
+
+cdef class Stinger:
+    cdef stinger * s
+    cdef bint free
+
+    def __cinit__(self, s=None):
+        if s is None:
+            self.s = stinger_new()
+            self.free = True
+        else:
+            self.s = <stinger *> <size_t> s
+            self.free = False
+
+    def __dealloc__(self):
+        if self.free and self.s is not NULL:
+            self.s = stinger_free_all(self.s)
+
+    def raw(self):
+        return <size_t> self.s
+
+    cpdef int64_t create_mapping(self, bytes name):
+        cdef int64_t vtx_out = 0
+        stinger_mapping_create(self.s, name, len(name), &vtx_out)
+        return vtx_out
+
+    cpdef int64_t get_mapping(self, bytes name):
+        return stinger_mapping_lookup(self.s, name, len(name))
+
+    def create_mappings(self, names):
+        cdef int64_t n = len(names)
+        cdef bytes buf = b'\0'.join(names) + b'\0'
+        cdef cnp.ndarray[cnp.int64_t] offsets = np.cumsum(
+            [0] + [len(name) + 1 for name in names]).astype(np.int64)
+        cdef cnp.ndarray[cnp.int64_t] out = np.empty(n, dtype=np.int64)
+        stinger_mapping_create_batch(self.s, buf,
+            <int64_t *> cnp.PyArray_DATA(offsets), n,
+            <int64_t *> cnp.PyArray_DATA(out))
+        return out
+
+    cpdef int64_t mapping_nv(self):
+        return stinger_mapping_nv(self.s)
+
+    cpdef insert_edge(self, int64_t vfrom, int64_t vto, int64_t etype=0,
+                      int64_t weight=1, int64_t ts=1):
+        stinger_insert_edge(self.s, etype, vfrom, vto, weight, ts)
+
+    cpdef insert_edge_pair(self, int64_t vfrom, int64_t vto, int64_t etype=0,
+                           int64_t weight=1, int64_t ts=1):
+        stinger_insert_edge_pair(self.s, etype, vfrom, vto, weight, ts)
+
+    cpdef increment_edge(self, int64_t vfrom, int64_t vto, int64_t etype=0,
+                         int64_t weight=1, int64_t ts=1):
+        stinger_incr_edge(self.s, etype, vfrom, vto, weight, ts)
+
+    cpdef increment_edge_pair(self, int64_t vfrom, int64_t vto, int64_t etype=0,
+                              int64_t weight=1, int64_t ts=1):
+        stinger_incr_edge_pair(self.s, etype, vfrom, vto, weight, ts)
+
+    cpdef remove_edge(self, int64_t vfrom, int64_t vto, int64_t etype=0):
+        if vfrom > 0 and vto > 0:
+            stinger_remove_edge(self.s, etype, vfrom, vto)
+
+    cpdef remove_edge_pair(self, int64_t vfrom, int64_t vto, int64_t etype=0):
+        if vfrom > 0 and vto > 0:
+            stinger_remove_edge_pair(self.s, etype, vfrom, vto)
+
+    def insert_edges(self, cnp.ndarray[cnp.int64_t] vfroms,
+                     cnp.ndarray[cnp.int64_t] vtos,
+                     cnp.ndarray[cnp.int64_t] etypes,
+                     cnp.ndarray[cnp.int64_t] weights,
+                     cnp.ndarray[cnp.int64_t] ts,
+                     bint directed=True):
+        cdef int64_t n = vfroms.shape[0]
+        cdef int rtn
+        cdef const int64_t * p_etypes = <int64_t *> cnp.PyArray_DATA(etypes)
+        cdef const int64_t * p_vfroms = <int64_t *> cnp.PyArray_DATA(vfroms)
+        cdef const int64_t * p_vtos = <int64_t *> cnp.PyArray_DATA(vtos)
+        cdef const int64_t * p_weights = <int64_t *> cnp.PyArray_DATA(weights)
+        cdef const int64_t * p_ts = <int64_t *> cnp.PyArray_DATA(ts)
+        with nogil:
+            if directed:
+                rtn = stinger_insert_edges(self.s, p_etypes, p_vfroms, p_vtos,
+                                           p_weights, p_ts, n)
+            else:
+                rtn = stinger_insert_edge_pairs(self.s, p_etypes, p_vfroms,
+                                                p_vtos, p_weights, p_ts, n)
+        return rtn
+
+    cpdef int64_t indegree(self, int64_t vtx):
+        return stinger_indegree_get(self.s, vtx)
+
+    cpdef int64_t outdegree(self, int64_t vtx):
+        return stinger_outdegree_get(self.s, vtx)
+
+    def successors_of(self, int64_t vtx):
+        cdef int64_t deg = stinger_outdegree_get(self.s, vtx)
+        cdef size_t outlen = 0
+        cdef cnp.ndarray[cnp.int64_t] neighbor = np.empty(deg, dtype=np.int64)
+        cdef cnp.ndarray[cnp.int64_t] weight = np.empty(deg, dtype=np.int64)
+        cdef cnp.ndarray[cnp.int64_t] timefirst = np.empty(deg, dtype=np.int64)
+        cdef cnp.ndarray[cnp.int64_t] timerecent = np.empty(deg, dtype=np.int64)
+        cdef cnp.ndarray[cnp.int64_t] etype = np.empty(deg, dtype=np.int64)
+        stinger_gather_successors(self.s, vtx, &outlen,
+            <int64_t *> cnp.PyArray_DATA(neighbor),
+            <int64_t *> cnp.PyArray_DATA(weight),
+            <int64_t *> cnp.PyArray_DATA(timefirst),
+            <int64_t *> cnp.PyArray_DATA(timerecent),
+            <int64_t *> cnp.PyArray_DATA(etype), deg)
+        return neighbor, weight, timefirst, timerecent, etype
@@ -1,5 +1,15 @@
 from ctypes import *
+import logging
 import os
+import struct
+import threading
+try:
+  import Queue as _queue_mod
+except ImportError:
+  import queue as _queue_mod
+
+import numpy as np
+
 from stinger_core import Stinger
 
 if(os.getenv('STINGER_LIB_PATH')):
@@ -7,6 +17,8 @@ if(os.getenv('STINGER_LIB_PATH')):
 else:
   libstinger_net = cdll.LoadLibrary('libstinger_net.so')
 
+_log = logging.getLogger(__name__)
+
 class StingerAlgParams(Structure):
   _fields_ = [("name", c_char_p),
 	      ("host", c_char_p),
@@ -35,6 +47,30 @@ class StingerEdgeUpdate(Structure):
 	      ("result", c_int64),
 	      ("meta_index", c_int64)]
 
+# Record sizes in bytes, computed once; the buffer grow/shrink paths
+# use these instead of re-running the reflective sizeof() per call.
+_EDGE_SZ = sizeof(StingerEdgeUpdate)
+
+# NumPy record dtype with the exact memory layout of StingerEdgeUpdate
+# (pointer fields appear as uintp).  Batches built as record arrays can
+# be handed to the C side by pointer with no per-record copying, and
+# existing ctypes batches can be viewed columnwise for vectorized work.
+_EDGE_UPDATE_FORMATS = {c_int64: np.int64, c_char_p: np.uintp}
+EDGE_UPDATE_DTYPE = np.dtype({
+    'names': [f[0] for f in StingerEdgeUpdate._fields_],
+    'formats': [_EDGE_UPDATE_FORMATS[f[1]] for f in StingerEdgeUpdate._fields_],
+    'offsets': [getattr(StingerEdgeUpdate, f[0]).offset for f in StingerEdgeUpdate._fields_],
+    'itemsize': _EDGE_SZ})
+
+def edge_updates_to_numpy(batch):
+  """Zero-copy record-array view of a StingerEdgeUpdate ctypes array."""
+  return np.frombuffer(batch, dtype=EDGE_UPDATE_DTYPE)
+
+def edge_updates_from_numpy(arr):
+  """Zero-copy StingerEdgeUpdate ctypes array over an EDGE_UPDATE_DTYPE
+  record array; the NumPy array must stay alive while the view is used."""
+  return (StingerEdgeUpdate * len(arr)).from_buffer(arr)
+
 class StingerVertexUpdate(Structure):
   _fields_ = [("vertex", c_int64),
 	      ("vertex_str", c_char_p),
@@ -44,6 +80,42 @@ class StingerVertexUpdate(Structure):
 	      ("incr_weight", c_int64),
 	      ("meta_index", c_int64)]
 
+_VTX_SZ = sizeof(StingerVertexUpdate)
+
+# Whole-record writers matching the field layouts above (q = int64,
+# P = pointer).  One pack_into replaces six to eight ctypes field
+# assignments, each of which walks the descriptor machinery; the
+# all-integer paths in StingerStream write records this way.
+_EDGE_STRUCT = struct.Struct('qPqPqPqqqq')
+_VTX_STRUCT = struct.Struct('qPqPqqq')
+
+# Optional numba fast path for the SoA-to-AoS conversion of large
+# integer batches: one fused pass over the columns instead of one
+# strided scatter per column.  Only worth the njit call overhead above
+# a threshold; without numba the NumPy scatters are used throughout.
+try:
+  import numba as _numba
+except ImportError:
+  _numba = None
+
+_NUMBA_PACK_THRESHOLD = 10000
+
+if _numba is not None:
+  @_numba.njit(cache=True)
+  def _pack_edges_njit(out, etypes, srcs, dsts, ws, ts):
+    # out is the (n, 10)-int64 view of an EDGE_UPDATE_DTYPE segment
+    # (10 slots: 6 id/pointer fields plus weight, time, result,
+    # meta_index); the segment is pre-zeroed, so only the five live
+    # columns are written.
+    for i in range(out.shape[0]):
+      out[i, 0] = etypes[i]
+      out[i, 2] = srcs[i]
+      out[i, 4] = dsts[i]
+      out[i, 6] = ws[i]
+      out[i, 7] = ts[i]
+else:
+  _pack_edges_njit = None
+
 class StingerRegisteredAlg(Structure):
   _fields_ = [("enabled", c_int),
 	      ("map_private", c_int),
@@ -80,144 +152,495 @@ class StingerRegisteredAlg(Structure):
   def stinger():
     return Stinger(s=self.stinger)
 
+def _to_bytes(name):
+  # Encode string arguments once at the boundary; with c_char_p
+  # argtypes the bytes object is passed straight through with no
+  # temporary ctypes wrapper.
+  if isinstance(name, unicode):
+    return name.encode('utf-8')
+  return name
+
+def _bind(name, argtypes, restype):
+  # One symbol lookup and one argtypes/restype setup per function at
+  # import; indexing libstinger_net['name'] at each call site builds a
+  # fresh function object per call and leaves the default int restype,
+  # which truncates pointers and 64-bit returns.  Attribute access
+  # caches the function object on the CDLL instance, so any later
+  # lookup of the same symbol gets this configured object back.  CDLL
+  # calls drop the GIL for the duration of the C call (PyDLL is the
+  # GIL-holding variant), which is what lets the send_batch_async
+  # worker's stream_send_batch overlap Python-side accumulation.
+  fn = getattr(libstinger_net, name)
+  fn.argtypes = argtypes
+  fn.restype = restype
+  return fn
+
+_stream_connect = _bind('stream_connect', [c_char_p, c_int], c_int)
+_stream_send_batch = _bind('stream_send_batch',
+    [c_int, c_int, POINTER(StingerEdgeUpdate), c_int64,
+     POINTER(StingerEdgeUpdate), c_int64,
+     POINTER(StingerVertexUpdate), c_int64, c_bool], None)
+
+_stinger_register_alg_impl = _bind('stinger_register_alg_impl',
+    [StingerAlgParams], POINTER(StingerRegisteredAlg))
+_stinger_alg_begin_init = _bind('stinger_alg_begin_init', [POINTER(StingerRegisteredAlg)], POINTER(StingerRegisteredAlg))
+_stinger_alg_end_init = _bind('stinger_alg_end_init', [POINTER(StingerRegisteredAlg)], POINTER(StingerRegisteredAlg))
+_stinger_alg_begin_pre = _bind('stinger_alg_begin_pre', [POINTER(StingerRegisteredAlg)], POINTER(StingerRegisteredAlg))
+_stinger_alg_end_pre = _bind('stinger_alg_end_pre', [POINTER(StingerRegisteredAlg)], POINTER(StingerRegisteredAlg))
+_stinger_alg_begin_post = _bind('stinger_alg_begin_post', [POINTER(StingerRegisteredAlg)], POINTER(StingerRegisteredAlg))
+_stinger_alg_end_post = _bind('stinger_alg_end_post', [POINTER(StingerRegisteredAlg)], POINTER(StingerRegisteredAlg))
+_stinger_alg_max_vertices = _bind('stinger_alg_max_vertices', [c_void_p], c_int64)
+_stinger_alg_weight_double = _bind('stinger_alg_weight_double', [c_void_p, c_void_p, c_double], None)
+
+_stinger_alg_state_get_name = _bind('stinger_alg_state_get_name', [c_void_p], c_char_p)
+_stinger_alg_state_get_data_description = _bind('stinger_alg_state_get_data_description', [c_void_p], c_char_p)
+_stinger_alg_state_get_data_ptr = _bind('stinger_alg_state_get_data_ptr', [c_void_p], c_void_p)
+_stinger_alg_state_data_per_vertex = _bind('stinger_alg_state_data_per_vertex', [c_void_p], c_int64)
+_stinger_alg_state_level = _bind('stinger_alg_state_level', [c_void_p], c_int64)
+_stinger_alg_state_number_dependencies = _bind('stinger_alg_state_number_dependencies', [c_void_p], c_int64)
+_stinger_alg_state_depencency = _bind('stinger_alg_state_depencency', [c_void_p, c_int64], c_char_p)
+
+_mon_connect = _bind('mon_connect', [c_int, c_char_p, c_char_p], c_int)
+_get_stinger_mon = _bind('get_stinger_mon', [], c_void_p)
+_stinger_mon_num_algs = _bind('stinger_mon_num_algs', [c_void_p], c_size_t)
+_stinger_mon_get_alg_state = _bind('stinger_mon_get_alg_state', [c_void_p, c_int64], c_void_p)
+_stinger_mon_get_alg_state_by_name = _bind('stinger_mon_get_alg_state_by_name', [c_void_p, c_char_p], c_void_p)
+_stinger_mon_has_alg = _bind('stinger_mon_has_alg', [c_void_p, c_char_p], c_int)
+_stinger_mon_get_read_lock = _bind('stinger_mon_get_read_lock', [c_void_p], None)
+_stinger_mon_release_read_lock = _bind('stinger_mon_release_read_lock', [c_void_p], None)
+_stinger_mon_get_stinger = _bind('stinger_mon_get_stinger', [c_void_p], c_void_p)
+_stinger_mon_wait_for_sync = _bind('stinger_mon_wait_for_sync', [c_void_p], None)
+
+# Initial capacity of the per-stream batch buffers, and how many
+# consecutive sends must use under a quarter of a buffer's capacity
+# before it is halved back toward that floor.
+_BATCH_INITIAL_SIZE = 5000
+_SHRINK_AFTER = 8
+
 class StingerStream():
-  def __init__(self, host, port, strings=True, undirected=False):
-    self.sock_handle = libstinger_net['stream_connect'](c_char_p(host), c_int(port))
-    self.insertions_size = 5000
-    self.insertions = (StingerEdgeUpdate * self.insertions_size)()
-    self.insertions_refs = []
+  def __init__(self, host, port, strings=True, undirected=False,
+	submission_threshold=None):
+    self._host_b = _to_bytes(host)
+    self.sock_handle = _stream_connect(self._host_b, port)
+    # Updates accumulate as plain tuples; send_batch fills persistent
+    # ctypes buffers that grow in place with ctypes.resize, so growth is
+    # a realloc (no copy when the allocation can extend) and steady-state
+    # sends allocate nothing.
+    self.insertions_list = []
+    self._insertions_bulk = []
     self.insertions_count = 0
-    self.deletions_size = 5000
-    self.deletions = (StingerEdgeUpdate * self.deletions_size)()
-    self.deletions_refs = []
+    # All-integer insertions accumulate structure-of-arrays: five int64
+    # columns instead of 80-byte records that are ~70% zero pointer and
+    # bookkeeping fields.  The columns become one EDGE_UPDATE_DTYPE
+    # segment at send_batch time via vectorized column scatters.
+    self._ins_cap = _BATCH_INITIAL_SIZE
+    self._ins_n = 0
+    self._ins_etype = np.zeros(self._ins_cap, dtype=np.int64)
+    self._ins_src = np.zeros(self._ins_cap, dtype=np.int64)
+    self._ins_dst = np.zeros(self._ins_cap, dtype=np.int64)
+    self._ins_w = np.zeros(self._ins_cap, dtype=np.int64)
+    self._ins_t = np.zeros(self._ins_cap, dtype=np.int64)
+    self.deletions_list = []
     self.deletions_count = 0
-    self.vertex_updates_size = 5000
-    self.vertex_updates = (StingerVertexUpdate * self.deletions_size)()
-    self.vertex_updates_refs = []
+    self.vertex_updates_list = []
     self.vertex_updates_count = 0
+    self.insertions_size = _BATCH_INITIAL_SIZE
+    self._insertions_buf = (StingerEdgeUpdate * self.insertions_size)()
+    self._insertions_quiet = 0
+    self.deletions_size = _BATCH_INITIAL_SIZE
+    self._deletions_buf = (StingerEdgeUpdate * self.deletions_size)()
+    self._deletions_quiet = 0
+    self.vertex_updates_size = _BATCH_INITIAL_SIZE
+    self._vertex_updates_buf = (StingerVertexUpdate * self.vertex_updates_size)()
+    self._vertex_updates_quiet = 0
     self.only_strings = strings
     self.undirected = undirected
+    # Async double-buffering (send_batch_async) is set up lazily by
+    # _start_send_worker so blocking-only streams pay nothing for it.
+    self._send_queue = None
+    self._send_worker = None
+    self._buffer_free = None
+    self._buffer_sets = None
+    self._active_set = 0
+    # When set, add_* calls flush implicitly (via send_batch_async)
+    # once the combined queued-update count reaches the threshold, so
+    # naive producers that queue millions of edges before one explicit
+    # send still overlap transfer with accumulation and cap peak memory.
+    self.submission_threshold = submission_threshold
+    # Edge/vertex type strings are low-cardinality (typically one per
+    # ingestion job) but repeated per update; each distinct string is
+    # encoded once here instead of per edge.  Vertex names are not
+    # cached: they are mostly unique, so a cache would only grow.
+    self._type_str_cache = {}
 
   def add_insert(self, vfrom, vto, etype=0, weight=0, ts=0, insert_strings=None):
+    # Polymorphic entry point: re-checks the argument types on every
+    # call.  Batches are almost always type-uniform, so hot producers
+    # should pick the matching specialized variant below once per batch
+    # (e.g. add = stream.add_insert_int_etype_int_vtx) and skip the
+    # per-edge isinstance dispatch entirely.
     self.only_strings = insert_strings if insert_strings is not None else self.only_strings
 
-    if(self.insertions_count >= self.insertions_size):
-      self.insertions_size *= 2
-      insertions_tmp = (StingerEdgeUpdate * self.insertions_size)()
-      self.insertions_refs.append(self.insertions)
-      memmove(addressof(insertions_tmp), addressof(self.insertions), sizeof(StingerEdgeUpdate * (self.insertions_size/2)))
-      self.insertions = insertions_tmp
-
     if(self.only_strings):
-      self.insertions[self.insertions_count].source_str = c_char_p(vfrom)
-      self.insertions[self.insertions_count].destination_str = c_char_p(vto)
-    else:
-      self.insertions[self.insertions_count].source_str = 0
-      self.insertions[self.insertions_count].destination_str = 0
-      self.insertions[self.insertions_count].source = c_int64(vfrom)
-      self.insertions[self.insertions_count].destination= c_int64(vto)
-
-    if isinstance(etype, basestring):
-      self.insertions[self.insertions_count].etype_str = c_char_p(etype)
+      if isinstance(etype, basestring):
+        self.add_insert_str_etype_str_vtx(vfrom, vto, etype, weight, ts)
+      else:
+        self.add_insert_int_etype_str_vtx(vfrom, vto, etype, weight, ts)
+    elif isinstance(etype, basestring):
+      self.add_insert_str_etype_int_vtx(vfrom, vto, etype, weight, ts)
     else:
-      self.insertions[self.insertions_count].etype = c_int64(etype)
-
-    self.insertions[self.insertions_count].weight = c_int64(weight)
-    self.insertions[self.insertions_count].time = c_int64(ts)
+      self.add_insert_int_etype_int_vtx(vfrom, vto, etype, weight, ts)
+
+  def _cached_type_bytes(self, name):
+    b = self._type_str_cache.get(name)
+    if b is None:
+      b = _to_bytes(name)
+      self._type_str_cache[name] = b
+    return b
+
+  def _maybe_autoflush(self):
+    if self.submission_threshold is None:
+      return
+    if (self.insertions_count + self.deletions_count
+	+ self.vertex_updates_count) >= self.submission_threshold:
+      self.send_batch_async()
+
+  def add_insert_int_etype_int_vtx(self, vfrom, vto, etype=0, weight=0, ts=0):
+    n = self._ins_n
+    if n == self._ins_cap:
+      self._grow_ins_columns()
+    self._ins_etype[n] = etype
+    self._ins_src[n] = vfrom
+    self._ins_dst[n] = vto
+    self._ins_w[n] = weight
+    self._ins_t[n] = ts
+    self._ins_n = n + 1
+    self.insertions_count += 1
+    self._maybe_autoflush()
 
+  def add_insert_str_etype_int_vtx(self, vfrom, vto, etype, weight=0, ts=0):
+    self.insertions_list.append((0, self._cached_type_bytes(etype), vfrom, None, vto, None, weight, ts))
     self.insertions_count += 1
+    self._maybe_autoflush()
 
-  def add_delete(self, vfrom, vto, etype=0):
-    if(self.deletions_count >= self.deletions_size):
-      self.deletions_size *= 2
-      deletions_tmp = (StingerEdgeUpdate * self.deletions_size)()
-      self.deletions_refs.append(self.deletions)
-      memmove(addressof(deletions_tmp), addressof(self.deletions), sizeof(StingerEdgeUpdate * (self.deletions_size/2)))
-      self.deletions = deletions_tmp
+  def add_insert_int_etype_str_vtx(self, vfrom, vto, etype=0, weight=0, ts=0):
+    self.insertions_list.append((etype, None, 0, _to_bytes(vfrom), 0, _to_bytes(vto), weight, ts))
+    self.insertions_count += 1
+    self._maybe_autoflush()
 
-    if(self.only_strings):
-      self.deletions[self.deletions_count].source_str = c_char_p(vfrom)
-      self.deletions[self.deletions_count].destination_str = c_char_p(vto)
+  def add_insert_str_etype_str_vtx(self, vfrom, vto, etype, weight=0, ts=0):
+    self.insertions_list.append((0, self._cached_type_bytes(etype), 0, _to_bytes(vfrom), 0, _to_bytes(vto), weight, ts))
+    self.insertions_count += 1
+    self._maybe_autoflush()
+
+  def _grow_ins_columns(self):
+    self._ins_cap *= 2
+    for name in ('_ins_etype', '_ins_src', '_ins_dst', '_ins_w', '_ins_t'):
+      col = getattr(self, name)
+      grown = np.zeros(self._ins_cap, dtype=np.int64)
+      grown[:col.shape[0]] = col
+      setattr(self, name, grown)
+
+  def _drain_ins_columns(self):
+    """Convert the accumulated integer columns into one EDGE_UPDATE_DTYPE
+    segment (one contiguous scatter per column) and reset the count.
+    Returns None when no integer insertions are queued."""
+    n = self._ins_n
+    if n == 0:
+      return None
+    seg = np.zeros(n, dtype=EDGE_UPDATE_DTYPE)
+    if _pack_edges_njit is not None and n >= _NUMBA_PACK_THRESHOLD:
+      _pack_edges_njit(seg.view(np.int64).reshape(n, 10),
+	  self._ins_etype[:n], self._ins_src[:n], self._ins_dst[:n],
+	  self._ins_w[:n], self._ins_t[:n])
     else:
-      self.deletions[self.deletions_count].source_str = 0
-      self.deletions[self.deletions_count].destination_str = 0
-      self.deletions[self.deletions_count].source = c_int64(vfrom)
-      self.deletions[self.deletions_count].destination= c_int64(vto)
+      seg['etype'] = self._ins_etype[:n]
+      seg['source'] = self._ins_src[:n]
+      seg['destination'] = self._ins_dst[:n]
+      seg['weight'] = self._ins_w[:n]
+      seg['time'] = self._ins_t[:n]
+    self._ins_n = 0
+    return seg
+
+  def add_insert_many(self, vfroms, vtos, etypes=0, weights=0, ts=0):
+    """Queue a column batch of integer edge insertions at once.
+
+    vfroms and vtos are array-likes of int64 vertex ids; etypes,
+    weights and ts may be scalars or array-likes.  The columns are
+    scattered into an EDGE_UPDATE_DTYPE record segment with vectorized
+    NumPy assignments (one strided write per column instead of one
+    Python-level add_insert per edge) and merged into the outgoing
+    buffer at send_batch time.
+    """
+    vfroms = np.ascontiguousarray(vfroms, dtype=np.int64)
+    n = vfroms.shape[0]
+    seg = np.zeros(n, dtype=EDGE_UPDATE_DTYPE)
+    seg['source'] = vfroms
+    seg['destination'] = np.ascontiguousarray(vtos, dtype=np.int64)
+    seg['etype'] = etypes
+    seg['weight'] = weights
+    seg['time'] = ts
+    self._insertions_bulk.append(seg)
+    self.insertions_count += n
+    self._maybe_autoflush()
 
+  def add_delete(self, vfrom, vto, etype=0):
     if isinstance(etype, basestring):
-      self.deletions[self.deletions_count].etype_str = c_char_p(etype)
+      et, ets = 0, self._cached_type_bytes(etype)
     else:
-      self.deletions[self.deletions_count].etype = c_int64(etype)
-
-    self.deletions_count += 1
-
-  def add_vertex_update(self, vtx, vtype, weight=0, incr_weight=0):
-    if(self.vertex_updates_count >= self.vertex_updates_size):
-      self.vertex_updates_size *= 2
-      vertex_updates_tmp = (StingerVertexUpdate * self.vertex_updates_size)()
-      self.vertex_updates_refs.append(self.vertex_updates)
-      memmove(addressof(vertex_updates_tmp), addressof(self.vertex_updates), sizeof(StingerVertexUpdate * (self.vertex_updates_size/2)))
-      self.vertex_updates = vertex_updates_tmp
-
+      et, ets = etype, None
     if(self.only_strings):
-      self.vertex_updates[self.vertex_updates_count].vertex_str = c_char_p(vtx)
+      self.deletions_list.append((et, ets, 0, _to_bytes(vfrom), 0, _to_bytes(vto), 0, 0))
     else:
-      self.vertex_updates[self.vertex_updates_count].vertex = c_int64(vtx)
-      self.vertex_updates[self.vertex_updates_count].vertex_str = 0
+      self.deletions_list.append((et, ets, vfrom, None, vto, None, 0, 0))
+    self.deletions_count += 1
+    self._maybe_autoflush()
 
+  def add_vertex_update(self, vtx, vtype, weight=0, incr_weight=0):
     if isinstance(vtype, basestring):
-      self.vertex_updates[self.vertex_updates_count].type_str = c_char_p(vtype)
+      vt, vts = 0, self._cached_type_bytes(vtype)
     else:
-      self.vertex_updates[self.vertex_updates_count].type = c_int64(vtype)
-
-    self.vertex_updates[self.vertex_updates_count].weight = c_int64(weight)
-    self.vertex_updates[self.vertex_updates_count].incr_weight = c_int64(incr_weight)
-
+      vt, vts = vtype, None
+    if(self.only_strings):
+      self.vertex_updates_list.append((0, _to_bytes(vtx), vt, vts, weight, incr_weight))
+    else:
+      self.vertex_updates_list.append((vtx, None, vt, vts, weight, incr_weight))
     self.vertex_updates_count += 1
-
-  def send_batch(self):
-    libstinger_net['stream_send_batch'](self.sock_handle, c_int(self.only_strings), 
-	     self.insertions, self.insertions_count, 
-       self.deletions, self.deletions_count, 
-       self.vertex_updates, self.vertex_updates_count,
-       self.undirected)
+    self._maybe_autoflush()
+
+  def _materialize_edges(self, records, buf, size, segments=None):
+    """Fill buf with records, resizing it in place if needed.
+
+    segments is an optional list of EDGE_UPDATE_DTYPE record arrays (from
+    add_insert_many); each is copied into buf with one vectorized NumPy
+    slice assignment ahead of the per-tuple records.  Returns (array view
+    of exactly the total entry count, new capacity).  The buffer is
+    reused across sends, so the string branch clears the pointer fields
+    it does not set rather than trusting stale bytes.
+    """
+    nbulk = sum(len(seg) for seg in segments) if segments else 0
+    n = nbulk + len(records)
+    if n > size:
+      size = max(n, size * 2)
+      resize(buf, size * _EDGE_SZ)
+    view = cast(buf, POINTER(StingerEdgeUpdate * n))[0]
+    sz = _EDGE_STRUCT.size
+    pack = _EDGE_STRUCT.pack_into
+    if nbulk:
+      np_view = np.frombuffer(view, dtype=EDGE_UPDATE_DTYPE)
+      pos = 0
+      for seg in segments:
+        np_view[pos:pos + len(seg)] = seg
+        pos += len(seg)
+    for i, (et, ets, src, srcs, dst, dsts, w, t) in enumerate(records, nbulk):
+      if ets is None and srcs is None:
+        # All-integer record: one pack_into instead of six ctypes
+        # field assignments.
+        pack(view, i * sz, et, 0, src, 0, dst, 0, w, t, 0, 0)
+      else:
+        rec = view[i]
+        if srcs is not None:
+          rec.source_str = srcs
+          rec.destination_str = dsts
+        else:
+          rec.source_str = None
+          rec.destination_str = None
+          rec.source = src
+          rec.destination = dst
+        if ets is not None:
+          rec.etype_str = ets
+        else:
+          rec.etype_str = None
+          rec.etype = et
+        rec.weight = w
+        rec.time = t
+    return view, size
+
+  def _materialize_vertex_updates(self, records, buf, size):
+    n = len(records)
+    if n > size:
+      size = max(n, size * 2)
+      resize(buf, size * _VTX_SZ)
+    view = cast(buf, POINTER(StingerVertexUpdate * n))[0]
+    sz = _VTX_STRUCT.size
+    pack = _VTX_STRUCT.pack_into
+    for i, (vtx, vtxs, vt, vts, w, incr) in enumerate(records):
+      if vtxs is None and vts is None:
+        pack(view, i * sz, vtx, 0, vt, 0, w, incr, 0)
+      else:
+        rec = view[i]
+        if vtxs is not None:
+          rec.vertex_str = vtxs
+        else:
+          rec.vertex_str = None
+          rec.vertex = vtx
+        if vts is not None:
+          rec.type_str = vts
+        else:
+          rec.type_str = None
+          rec.type = vt
+        rec.set_weight = w
+        rec.incr_weight = incr
+    return view, size
+
+  def _maybe_shrink(self, used, buf, size, itemsize, quiet):
+    """Halve a batch buffer that has stayed mostly idle.
+
+    Buffers grow to a spike's high-water mark and otherwise stay put;
+    after _SHRINK_AFTER consecutive sends that used under a quarter of
+    the capacity, give half of it back (never below the initial size).
+    Returns (new capacity, new quiet-send count).
+    """
+    if size > _BATCH_INITIAL_SIZE and used < size // 4:
+      quiet += 1
+      if quiet >= _SHRINK_AFTER:
+        size = max(_BATCH_INITIAL_SIZE, size // 2)
+        resize(buf, size * itemsize)
+        quiet = 0
+    else:
+      quiet = 0
+    return size, quiet
+
+  def _materialize_batch(self):
+    """Materialize all queued updates into the active buffers, reset the
+    queues, and return (insertions, n_ins, deletions, n_del,
+    vertex_updates, n_vtx) ready for one stream_send_batch call."""
+    segments = list(self._insertions_bulk)
+    soa_segment = self._drain_ins_columns()
+    if soa_segment is not None:
+      segments.append(soa_segment)
+    insertions, self.insertions_size = self._materialize_edges(
+	self.insertions_list, self._insertions_buf, self.insertions_size,
+	segments=segments)
+    deletions, self.deletions_size = self._materialize_edges(
+	self.deletions_list, self._deletions_buf, self.deletions_size)
+    vertex_updates, self.vertex_updates_size = self._materialize_vertex_updates(
+	self.vertex_updates_list, self._vertex_updates_buf, self.vertex_updates_size)
+    out = (insertions, self.insertions_count,
+	deletions, self.deletions_count,
+	vertex_updates, self.vertex_updates_count)
     self.insertions_count = 0
     self.deletions_count = 0
     self.vertex_updates_count = 0
-    self.insertions_refs = []
-    self.deletions_refs = []
-    self.vertex_updates_refs = []
+    del self.insertions_list[:]
+    del self._insertions_bulk[:]
+    del self.deletions_list[:]
+    del self.vertex_updates_list[:]
+    return out
+
+  def send_batch(self):
+    if self._send_queue is not None:
+      # Drain any in-flight async batch first so batches arrive in
+      # submission order.
+      self._send_queue.join()
+    ins, n_ins, dels, n_del, vtx, n_vtx = self._materialize_batch()
+    # argtypes on _stream_send_batch do the int conversions in C, so
+    # raw Python ints/bools go straight through with no per-call boxing.
+    _stream_send_batch(self.sock_handle, self.only_strings,
+	     ins, n_ins,
+       dels, n_del,
+       vtx, n_vtx,
+       self.undirected)
+    # Shrinking may realloc, so it only happens here, after the
+    # blocking send is done with the buffers; async batches skip it.
+    self.insertions_size, self._insertions_quiet = self._maybe_shrink(
+	n_ins, self._insertions_buf, self.insertions_size,
+	_EDGE_SZ, self._insertions_quiet)
+    self.deletions_size, self._deletions_quiet = self._maybe_shrink(
+	n_del, self._deletions_buf, self.deletions_size,
+	_EDGE_SZ, self._deletions_quiet)
+    self.vertex_updates_size, self._vertex_updates_quiet = self._maybe_shrink(
+	n_vtx, self._vertex_updates_buf, self.vertex_updates_size,
+	_VTX_SZ, self._vertex_updates_quiet)
+
+  def send_batch_async(self):
+    """Hand the queued updates to the send worker and return at once.
+
+    Double-buffered: the batch is materialized into the active buffer
+    set, queued for the worker thread, and accumulation switches to the
+    alternate set, so the producer builds the next batch while the
+    server processes this one.  Blocks only when the alternate set is
+    itself still being sent.  ctypes drops the GIL around the C call,
+    so the worker's send overlaps Python-side accumulation."""
+    if self._send_worker is None:
+      self._start_send_worker()
+    idx = self._active_set
+    batch = self._materialize_batch()
+    self._buffer_free[idx].clear()
+    self._send_queue.put((idx, self.only_strings, self.undirected) + batch)
+    self._swap_buffer_set()
+    self._buffer_free[self._active_set].wait()
+
+  def _start_send_worker(self):
+    self._send_queue = _queue_mod.Queue(maxsize=1)
+    self._buffer_free = (threading.Event(), threading.Event())
+    self._buffer_free[0].set()
+    self._buffer_free[1].set()
+    self._buffer_sets = [None,
+	[(StingerEdgeUpdate * _BATCH_INITIAL_SIZE)(), _BATCH_INITIAL_SIZE,
+	 (StingerEdgeUpdate * _BATCH_INITIAL_SIZE)(), _BATCH_INITIAL_SIZE,
+	 (StingerVertexUpdate * _BATCH_INITIAL_SIZE)(), _BATCH_INITIAL_SIZE]]
+    self._send_worker = threading.Thread(target=self._send_loop)
+    self._send_worker.daemon = True
+    self._send_worker.start()
+
+  def _send_loop(self):
+    while True:
+      (idx, strings, undirected,
+       ins, n_ins, dels, n_del, vtx, n_vtx) = self._send_queue.get()
+      try:
+        _stream_send_batch(self.sock_handle, strings,
+	    ins, n_ins, dels, n_del, vtx, n_vtx, undirected)
+      finally:
+        self._buffer_free[idx].set()
+        self._send_queue.task_done()
+
+  def _swap_buffer_set(self):
+    self._buffer_sets[self._active_set] = [
+	self._insertions_buf, self.insertions_size,
+	self._deletions_buf, self.deletions_size,
+	self._vertex_updates_buf, self.vertex_updates_size]
+    self._active_set = 1 - self._active_set
+    (self._insertions_buf, self.insertions_size,
+     self._deletions_buf, self.deletions_size,
+     self._vertex_updates_buf, self.vertex_updates_size) = self._buffer_sets[self._active_set]
 
 
 class StingerAlg():
   def __init__(self, params):
-    register = libstinger_net['stinger_register_alg_impl']
-    register.argtypes = [StingerAlgParams]
-    register.restype = POINTER(StingerRegisteredAlg)
-    self.alg_ptr = register(params)
+    self.alg_ptr = _stinger_register_alg_impl(params)
     self.alg = self.alg_ptr[0]
 
   def begin_init(self):
-    libstinger_net['stinger_alg_begin_init'](self.alg_ptr)
+    _stinger_alg_begin_init(self.alg_ptr)
 
   def end_init(self):
-    libstinger_net['stinger_alg_end_init'](self.alg_ptr)
+    _stinger_alg_end_init(self.alg_ptr)
 
   def begin_pre(self):
-    libstinger_net['stinger_alg_begin_pre'](self.alg_ptr)
+    _stinger_alg_begin_pre(self.alg_ptr)
 
   def end_pre(self):
-    libstinger_net['stinger_alg_end_pre'](self.alg_ptr)
+    _stinger_alg_end_pre(self.alg_ptr)
 
   def begin_post(self):
-    libstinger_net['stinger_alg_begin_post'](self.alg_ptr)
+    _stinger_alg_begin_post(self.alg_ptr)
 
   def end_post(self):
-    libstinger_net['stinger_alg_end_post'](self.alg_ptr)
+    _stinger_alg_end_post(self.alg_ptr)
 
   def stinger(self):
     return Stinger(s=self.alg.stinger)
 
+# Element sizes and pointer types of the data-description type codes
+# used by alg data arrays ('d'ouble, 'l'ong, 'f'loat, 'i'nt, 'b'yte).
+# The POINTER() types are created once here; building them per array
+# would redo the lookup-or-create dance for every monitor poll.
+_DTYPE_SIZE = {'d': 8, 'l': 8, 'f': 4, 'i': 4, 'b': 1}
+_DTYPE_PTR = {'d': POINTER(c_double), 'l': POINTER(c_int64),
+	      'f': POINTER(c_float), 'i': POINTER(c_int32),
+	      'b': POINTER(c_int8)}
+
 class StingerDataArray():
   def __init__(self, data_ptr, data_desc, field_name, s):
     data_desc = data_desc.split()
@@ -225,36 +648,30 @@ class StingerDataArray():
     if not isinstance(data_ptr, int):
       data_ptr = data_ptr.value
 
-    print data_desc
+    _log.debug("data_desc=%s", data_desc)
     field_index = data_desc[1:].index(field_name)
 
     self.field_name = field_name
     self.data_type = data_desc[0][field_index]
-    self.nv = libstinger_net['stinger_alg_max_vertices'](s.raw())
+    self.nv = _stinger_alg_max_vertices(s.raw())
     self.s = s
 
-    offset = reduce(
-	lambda x,y: x+y,
-	[8 if c == 'd' or c == 'l' else
-	 4 if c == 'f' or c == 'i' else
-	 1
-	   for c in data_desc[0][:field_index]],
-	0)
-
-    self.data = data_ptr + (offset * self.nv)
-
-    if self.data_type == 'd':
-      self.data = cast(self.data, POINTER(c_double))
-    elif self.data_type == 'f':
-      self.data = cast(self.data, POINTER(c_float))
-    elif self.data_type == 'l':
-      self.data = cast(self.data, POINTER(c_int64))
-    elif self.data_type == 'i':
-      self.data = cast(self.data, POINTER(c_int32))
-    else: #self.data_type == 'b'
-      self.data = cast(self.data, POINTER(c_int8))
+    offset = sum(_DTYPE_SIZE[c] for c in data_desc[0][:field_index])
+
+    self.data = cast(data_ptr + (offset * self.nv), _DTYPE_PTR[self.data_type])
+
+  def as_numpy(self):
+    """NumPy view over the per-vertex data, backed by the same memory.
+
+    Reads and writes go straight to the algorithm's buffer, so bulk
+    operations run vectorized instead of one ctypes dereference per
+    vertex; the view is only valid while the algorithm data is mapped.
+    """
+    return np.ctypeslib.as_array(self.data, shape=(self.nv,))
 
   def __getitem__(self, i):
+    if isinstance(i, slice):
+      return self.as_numpy()[i]
     if isinstance(i, basestring):
       i = self.s.get_mapping(i)
     return self.data[i] if i >= 0 else 0
@@ -272,80 +689,74 @@ class StingerDataArray():
     return self.data
 
   def weight_double(self, weight):
-    libstinger_net['stinger_alg_weight_double'](self.s.raw(), self.data, c_double(weight))
+    _stinger_alg_weight_double(self.s.raw(), self.data, weight)
 
 
 class StingerAlgState():
   def __init__(self, alg, stinger):
     self.alg = alg
     self.s = stinger
+    # Name and data description are fixed for the life of a registered
+    # algorithm, so they are fetched and decoded once on first use.
+    self._name = None
+    self._data_description = None
 
   def get_name(self):
-    dd = libstinger_net['stinger_alg_state_get_name']
-    dd.restype = c_char_p
-    return str(dd(self.alg))
+    if self._name is None:
+      self._name = _stinger_alg_state_get_name(self.alg).decode('utf-8')
+    return self._name
 
   def get_data_description(self):
-    dd = libstinger_net['stinger_alg_state_get_data_description']
-    dd.restype = c_char_p
-    return str(dd(self.alg))
+    if self._data_description is None:
+      self._data_description = _stinger_alg_state_get_data_description(self.alg).decode('utf-8')
+    return self._data_description
 
   def get_data_ptr(self):
-    dp = libstinger_net['stinger_alg_state_get_data_ptr']
-    dp.restype = c_void_p
-    return c_void_p(dp(self.alg))
+    return c_void_p(_stinger_alg_state_get_data_ptr(self.alg))
 
   def get_data_array(self, name):
     return StingerDataArray(self.get_data_ptr(), self.get_data_description(), name, self.s)
 
   def get_data_per_vertex(self):
-    return libstinger_net['stinger_alg_state_data_per_vertex'](self.alg)
+    return _stinger_alg_state_data_per_vertex(self.alg)
 
   def get_level(self):
-    return libstinger_net['stinger_alg_state_level'](self.alg)
+    return _stinger_alg_state_level(self.alg)
 
   def number_of_dependencies(self):
-    return libstinger_net['stinger_alg_state_number_dependencies'](self.alg)
+    return _stinger_alg_state_number_dependencies(self.alg)
 
   def get_dependency(self, i):
-    dep = libstinger_net['stinger_alg_state_depencency']
-    dep.restype = c_char_p
-    return dep(self.alg, c_int64(i))
+    return _stinger_alg_state_depencency(self.alg, i)
 
 
 class StingerMon():
   def __init__(self, name, host='localhost', port=10103):
-    libstinger_net['mon_connect'](c_int(port), c_char_p(host), c_char_p(name))
-    get_mon = libstinger_net['get_stinger_mon']
-    get_mon.restype = c_void_p
-    self.mon = c_void_p(get_mon())
+    self._host_b = _to_bytes(host)
+    self._name_b = _to_bytes(name)
+    _mon_connect(port, self._host_b, self._name_b)
+    self.mon = c_void_p(_get_stinger_mon())
 
   def num_algs(self):
-    return libstinger_net['stinger_mon_num_algs'](self.mon)
+    return _stinger_mon_num_algs(self.mon)
 
   def get_alg_state(self, name_or_int):
     if isinstance(name_or_int, basestring):
-      get_alg = libstinger_net['stinger_mon_get_alg_state_by_name']
-      get_alg.restype = c_void_p
-      return StingerAlgState(c_void_p(get_alg(self.mon, c_char_p(name_or_int))), self.stinger())
+      return StingerAlgState(c_void_p(_stinger_mon_get_alg_state_by_name(self.mon, _to_bytes(name_or_int))), self.stinger())
     else:
-      get_alg = libstinger_net['stinger_mon_get_alg_state']
-      get_alg.restype = c_void_p
-      return StingerAlgState(c_void_p(get_alg(self.mon, c_int64(name_or_int))), self.stinger())
+      return StingerAlgState(c_void_p(_stinger_mon_get_alg_state(self.mon, name_or_int)), self.stinger())
 
   def has_alg(self, name):
-    return libstinger_net['stinger_mon_has_alg'](self.mon, c_char_p(name))
+    return _stinger_mon_has_alg(self.mon, _to_bytes(name))
 
   def get_read_lock(self):
-    libstinger_net['stinger_mon_get_read_lock'](self.mon)
+    _stinger_mon_get_read_lock(self.mon)
 
   def release_read_lock(self):
-    libstinger_net['stinger_mon_release_read_lock'](self.mon)
+    _stinger_mon_release_read_lock(self.mon)
 
   def stinger(self):
-    get_stinger = libstinger_net['stinger_mon_get_stinger']
-    get_stinger.restype = c_void_p
-    return Stinger(s=c_void_p(get_stinger(self.mon)))
+    return Stinger(s=c_void_p(_stinger_mon_get_stinger(self.mon)))
 
   def wait_for_sync(self):
-    libstinger_net['stinger_mon_wait_for_sync'](self.mon)
+    _stinger_mon_wait_for_sync(self.mon)
@@ -532,6 +532,154 @@ TEST_F(StingerCoreTest, stinger_delete_edges) {
   }
 }
 
+TEST_F(StingerCoreTest, stinger_batch_edge_insertion) {
+  const int64_t n = 100;
+  int64_t types[n], froms[n], tos[n], weights[n], timestamps[n];
+
+  // Insert directed edges i -> i+100 on type 0
+  for (int64_t i=0; i < n; i++) {
+    types[i] = 0;
+    froms[i] = i;
+    tos[i] = i + 100;
+    weights[i] = 1;
+    timestamps[i] = i + 1;
+  }
+
+  int ret = stinger_insert_edges(S, types, froms, tos, weights, timestamps, n);
+  EXPECT_EQ(ret,0);
+
+  for (int64_t i=0; i < n; i++) {
+    EXPECT_EQ(stinger_outdegree_get(S,i),1);
+    EXPECT_EQ(stinger_indegree_get(S,i+100),1);
+    EXPECT_EQ(stinger_has_typed_successor(S, 0, i, i+100),1);
+  }
+
+  // Insert the same endpoints as undirected pairs on type 1
+  for (int64_t i=0; i < n; i++) {
+    types[i] = 1;
+  }
+
+  ret = stinger_insert_edge_pairs(S, types, froms, tos, weights, timestamps, n);
+  EXPECT_EQ(ret,0);
+
+  for (int64_t i=0; i < n; i++) {
+    EXPECT_EQ(stinger_has_typed_successor(S, 1, i, i+100),1);
+    EXPECT_EQ(stinger_has_typed_successor(S, 1, i+100, i),1);
+  }
+
+  int64_t consistency = stinger_consistency_check(S,S->max_nv);
+  EXPECT_EQ(consistency,0);
+}
+
+TEST_F(StingerCoreTest, stinger_batch_edge_removal) {
+  // Directed removal: batch contains one edge that was never inserted;
+  // the miss must not stop the batch or hide the removals after it.
+  stinger_insert_edge(S, 0, 1, 2, 1, 1);
+  stinger_insert_edge(S, 0, 3, 4, 1, 1);
+
+  int64_t types[3] = {0, 0, 0};
+  int64_t froms[3] = {1, 7, 3};
+  int64_t tos[3]   = {2, 8, 4};
+
+  int64_t removed = stinger_remove_edges(S, types, froms, tos, 3);
+  EXPECT_EQ(removed,2);
+  EXPECT_EQ(stinger_has_typed_successor(S, 0, 1, 2),0);
+  EXPECT_EQ(stinger_has_typed_successor(S, 0, 3, 4),0);
+
+  // Removing the same batch again finds nothing
+  removed = stinger_remove_edges(S, types, froms, tos, 3);
+  EXPECT_EQ(removed,0);
+
+  // Pair removal: a full pair, a half pair (directed edge, so only one
+  // direction exists), and a missing pair
+  stinger_insert_edge_pair(S, 0, 50, 51, 1, 1);
+  stinger_insert_edge(S, 0, 60, 61, 1, 1);
+
+  int64_t pfroms[3] = {50, 60, 70};
+  int64_t ptos[3]   = {51, 61, 71};
+
+  removed = stinger_remove_edge_pairs(S, types, pfroms, ptos, 3);
+  EXPECT_EQ(removed,2);
+  EXPECT_EQ(stinger_has_typed_successor(S, 0, 50, 51),0);
+  EXPECT_EQ(stinger_has_typed_successor(S, 0, 51, 50),0);
+  EXPECT_EQ(stinger_has_typed_successor(S, 0, 60, 61),0);
+
+  int64_t consistency = stinger_consistency_check(S,S->max_nv);
+  EXPECT_EQ(consistency,0);
+}
+
+TEST_F(StingerCoreTest, stinger_batch_mapping) {
+  // Names packed back to back, each NUL-terminated; offsets[count]
+  // marks the end of the buffer
+  const char byte_strings[] = "alpha\0beta\0gamma\0";
+  int64_t offsets[4] = {0, 6, 11, 17};
+  int64_t vtx_out[3] = {-2, -2, -2};
+
+  int ret = stinger_mapping_create_batch(S, byte_strings, offsets, 3, vtx_out);
+  EXPECT_EQ(ret,0);
+  for (int64_t i=0; i < 3; i++) {
+    EXPECT_GE(vtx_out[i],0);
+  }
+  EXPECT_NE(vtx_out[0],vtx_out[1]);
+  EXPECT_NE(vtx_out[1],vtx_out[2]);
+  EXPECT_NE(vtx_out[0],vtx_out[2]);
+
+  // Batch lookup agrees with the scalar lookup
+  int64_t lookup_out[3] = {-2, -2, -2};
+  stinger_mapping_lookup_batch(S, byte_strings, offsets, 3, lookup_out);
+  for (int64_t i=0; i < 3; i++) {
+    EXPECT_EQ(lookup_out[i],vtx_out[i]);
+  }
+  EXPECT_EQ(stinger_mapping_lookup(S, "beta", 4),vtx_out[1]);
+
+  // Unknown names come back as -1 without disturbing the rest
+  const char mixed_strings[] = "alpha\0missing\0";
+  int64_t mixed_offsets[3] = {0, 6, 14};
+  int64_t mixed_out[2] = {-2, -2};
+
+  stinger_mapping_lookup_batch(S, mixed_strings, mixed_offsets, 2, mixed_out);
+  EXPECT_EQ(mixed_out[0],vtx_out[0]);
+  EXPECT_EQ(mixed_out[1],-1);
+
+  // Re-creating existing names maps to the same vertices
+  int64_t vtx_again[3] = {-2, -2, -2};
+  ret = stinger_mapping_create_batch(S, byte_strings, offsets, 3, vtx_again);
+  EXPECT_EQ(ret,0);
+  for (int64_t i=0; i < 3; i++) {
+    EXPECT_EQ(vtx_again[i],vtx_out[i]);
+  }
+}
+
+TEST_F(StingerCoreTest, stinger_batch_ingest_named_edges) {
+  // Two edges between four named vertices: a->b and c->d
+  const char byte_strings[] = "a\0b\0c\0d\0";
+  int64_t from_off[2] = {0, 4};
+  int64_t to_off[2] = {2, 6};
+  int64_t types[2] = {0, 1};
+  int64_t weights[2] = {1, 2};
+  int64_t timestamps[2] = {1, 2};
+
+  int ret = stinger_ingest_named_edges(S, byte_strings, from_off, to_off,
+      types, weights, timestamps, 2);
+  EXPECT_EQ(ret,0);
+
+  int64_t a = stinger_mapping_lookup(S, "a", 1);
+  int64_t b = stinger_mapping_lookup(S, "b", 1);
+  int64_t c = stinger_mapping_lookup(S, "c", 1);
+  int64_t d = stinger_mapping_lookup(S, "d", 1);
+  EXPECT_GE(a,0);
+  EXPECT_GE(b,0);
+  EXPECT_GE(c,0);
+  EXPECT_GE(d,0);
+
+  EXPECT_EQ(stinger_has_typed_successor(S, 0, a, b),1);
+  EXPECT_EQ(stinger_has_typed_successor(S, 1, c, d),1);
+  EXPECT_EQ(stinger_edgeweight(S, c, d, 1),2);
+
+  int64_t consistency = stinger_consistency_check(S,S->max_nv);
+  EXPECT_EQ(consistency,0);
+}
+
 TEST_F(StingerCoreTest, racing_deletions) {
   int64_t ret;
   // Insert undirected edges
@@ -1021,6 +1169,59 @@ TEST_F(StingerCoreTest, gather_successors) {
   EXPECT_EQ(outlen, 0);
 }
 
+TEST_F(StingerCoreTest, gather_successors_range) {
+  for (int j=1; j < 100; j++) {
+    stinger_insert_edge(S, (j%2)?1:0, 0, j, j, j);
+  }
+
+  int64_t * full_vtx = (int64_t *)xcalloc(100,sizeof(int64_t));
+  int64_t * out_vtx = (int64_t *)xcalloc(100,sizeof(int64_t));
+  int64_t * out_weight = (int64_t *)xcalloc(100,sizeof(int64_t));
+  int64_t * out_timefirst = (int64_t *)xcalloc(100,sizeof(int64_t));
+  int64_t * out_timerecent = (int64_t *)xcalloc(100,sizeof(int64_t));
+  int64_t * out_type = (int64_t *)xcalloc(100,sizeof(int64_t));
+
+  size_t outlen;
+
+  // PART 1: start 0 behaves like a plain gather
+  stinger_gather_successors_range(S, 0, 0, &outlen, full_vtx, NULL, NULL, NULL, NULL, 100);
+  EXPECT_EQ(outlen, 99);
+
+  // PART 2: a start offset returns the tail of the same stable order
+  stinger_gather_successors_range(S, 0, 50, &outlen, out_vtx, out_weight, out_timefirst, out_timerecent, out_type, 100);
+  EXPECT_EQ(outlen, 49);
+
+  for (int64_t i=0; i < outlen; i++) {
+    EXPECT_EQ(out_vtx[i],full_vtx[i+50]);
+    EXPECT_EQ(out_weight[i],out_vtx[i]);
+    EXPECT_EQ(out_timefirst[i],out_vtx[i]);
+    EXPECT_EQ(out_timerecent[i],out_vtx[i]);
+    EXPECT_EQ(out_type[i],(out_vtx[i]%2)?1:0);
+  }
+
+  // PART 3: chunked walk covers every successor exactly once
+  size_t total = 0;
+  do {
+    stinger_gather_successors_range(S, 0, total, &outlen, out_vtx, NULL, NULL, NULL, NULL, 10);
+    for (int64_t i=0; i < outlen; i++) {
+      EXPECT_EQ(out_vtx[i],full_vtx[total+i]);
+    }
+    total += outlen;
+  } while (outlen == 10);
+  EXPECT_EQ(total, 99);
+
+  // PART 4: a start past the degree yields nothing
+  stinger_gather_successors_range(S, 0, 200, &outlen, out_vtx, NULL, NULL, NULL, NULL, 100);
+  EXPECT_EQ(outlen, 0);
+
+  xfree(full_vtx);
+  xfree(out_vtx);
+  xfree(out_weight);
+  xfree(out_timefirst);
+  xfree(out_timerecent);
+  xfree(out_type);
+}
+
 TEST_F(StingerCoreTest, gather_predecessors) {
   OMP("omp parallel for")
   for (int i=0; i < 100; i++) {